@@ -31,18 +31,48 @@ v6.1.0.1
 
 from pathlib import Path
 import re
+import functools
 import shutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import threading
-from time import sleep
-from typing import Optional, Dict, Any, Set, List, Callable, Tuple
+from time import sleep, time, monotonic
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, Set, List, Callable, Tuple, Iterator
 import json
-from dataclasses import dataclass
+import sqlite3
+from dataclasses import dataclass, replace
 from enum import Enum
 import os
+import errno
 import sys
 from datetime import datetime
+try: # optional: faster JSON decoding of API responses and cache rows
+    import orjson
+    _json_loads = orjson.loads
+except ImportError: orjson, _json_loads = None, json.loads
+try: # optional: kernel file-change notifications for watch mode; without it the watcher polls the source dir's mtime
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError: Observer, FileSystemEventHandler = None, object
+
+API_CACHE_TTL = 30 * 86400 # seconds a cached API response stays valid
+API_MEMORY_CACHE_SIZE = 4096 # API responses kept in memory in front of the SQLite cache
+API_MAX_CONCURRENCY = 4 # simultaneous HTTP lookups per APIClient
+SORT_WORKERS = 8 # items classified and moved concurrently during a sort run
+ANILIST_BATCH_SIZE = 10 # titles per aliased AniList GraphQL request
+WATCH_DEBOUNCE = 2.0 # seconds of quiet after a file event before a watch-mode sort starts
+ANILIST_MEDIA_FIELDS = "title { romaji english native } format, genres, season, seasonYear, episodes"
+
+def _json_dumps(obj: Any) -> str: return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+def _response_json(r: requests.Response) -> Any:
+    # Decodes the raw body directly; a malformed payload surfaces as a RequestException like a failed request would.
+    try: return _json_loads(r.content)
+    except ValueError as e: raise requests.RequestException(f"Invalid JSON from {r.url}: {e}") from e
+
+_FORBIDDEN_FS_CHARS = str.maketrans('', '', '<>:"/\\|?*') # deletion table for characters Windows rejects in file and folder names
 
 # --- Public Classes & Enums ---
 
@@ -54,7 +84,7 @@ class MediaInfo:
     title: str; year: Optional[str]; media_type: MediaType; language: Optional[str]; genre: Optional[str]; season: Optional[int] = None
     def get_folder_name(self) -> str:
         if not self.title: return "Unknown"
-        folder_title = re.sub(r'[<>:"/\\|?*]', '', self.title).strip()
+        folder_title = self.title.translate(_FORBIDDEN_FS_CHARS).strip()
         if self.year: return f"{folder_title} ({self.year})"
         return folder_title
 
@@ -63,6 +93,36 @@ def setup_logging(log_file: Path, log_to_console: bool = False):
     if log_to_console: handlers.append(logging.StreamHandler(sys.stdout))
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s", handlers=handlers, force=True)
 
+def _scandir_files(root: Path, prune: Optional[Path] = None) -> Iterator[os.DirEntry]:
+    """Single os.scandir walk over root; directory type bits come from the dirent, so no extra stat per entry. The prune dir is not descended into."""
+    stack = [os.fspath(root)]
+    try: prune_ino = os.stat(prune).st_ino if prune else None
+    except OSError: prune_ino = None
+    while stack:
+        try: it = os.scandir(stack.pop())
+        except OSError: continue
+        with it:
+            for e in it:
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        # The dirent inode is free; samefile only runs on a candidate match.
+                        if prune_ino is None or e.inode() != prune_ino or not os.path.samefile(e.path, prune): stack.append(e.path)
+                    elif e.is_file(): yield e
+                except OSError: continue
+
+def iter_file_paths(root: Path, exts: Tuple[str, ...]) -> Iterator[str]:
+    """Path strings of files under root whose lowercased name ends with one of exts."""
+    return (e.path for e in _scandir_files(root) if e.name.lower().endswith(exts))
+
+def iter_files(root: Path, exts: Tuple[str, ...]) -> Iterator[Path]: return map(Path, iter_file_paths(root, exts))
+
+def iter_files_by_suffix(root: Path, suffixes: frozenset, prune: Optional[Path] = None) -> Iterator[Tuple[Path, str]]:
+    """(path, lowercased suffix) for files under root whose suffix is in suffixes; one hash lookup per name."""
+    for e in _scandir_files(root, prune):
+        # Inline rfind equivalent of os.path.splitext(name)[1] (leading dots do not start a suffix); a Path is built only for matches.
+        n = e.name; d = n.rfind('.')
+        if d > 0 and (n[0] != '.' or n[:d].strip('.')) and (sfx := n[d:].lower()) in suffixes: yield Path(e.path), sfx
+
 class Config:
     def __init__(self):
         self.SOURCE_DIR, self.MOVIES_DIR, self.TV_SHOWS_DIR, self.ANIME_MOVIES_DIR, self.ANIME_SERIES_DIR, self.MISMATCHED_DIR = "", "", "", "", "", ""
@@ -74,7 +134,22 @@ class Config:
         self.REQUEST_DELAY, self.WATCH_INTERVAL, self.FALLBACK_SHOW_DESTINATION = 1.0, 900, "mismatched"
         self.LANGUAGES_TO_SPLIT, self.SPLIT_MOVIES_DIR = ["fr"], ""
         self.MOVIES_ENABLED, self.TV_SHOWS_ENABLED, self.ANIME_MOVIES_ENABLED, self.ANIME_SERIES_ENABLED, self.CLEANUP_MODE_ENABLED = True, True, True, True, False
-
+        self._source_path: Optional[Path] = None; self.refresh_derived()
+
+    def refresh_derived(self):
+        """Rebuilds values derived from the settings; call after changing SUPPORTED_EXTENSIONS, SIDECAR_EXTENSIONS or CUSTOM_STRINGS_TO_REMOVE."""
+        self._supported_ext_set = frozenset(e.lower() for e in self.SUPPORTED_EXTENSIONS); self._sidecar_ext_set = frozenset(e.lower() for e in self.SIDECAR_EXTENSIONS)
+        self._ext_tuple = tuple(self._supported_ext_set); self._custom_strings_set = frozenset(self.CUSTOM_STRINGS_TO_REMOVE)
+    @property
+    def ext_tuple(self) -> Tuple[str, ...]: return self._ext_tuple
+    @property
+    def supported_ext_set(self) -> frozenset: return self._supported_ext_set
+    @property
+    def sidecar_ext_set(self) -> frozenset: return self._sidecar_ext_set
+    @property
+    def custom_strings_set(self) -> frozenset: return self._custom_strings_set # frozenset() of it is a no-op and its hash is cached, so the remover lookup is free
+    @property
+    def api_cache_path(self) -> Optional[Path]: return self._source_path.with_name("api_cache.sqlite") if self._source_path else None
     def get_path(self, key: str) -> Optional[Path]:
         p = getattr(self, key); return Path(p) if p else None
     def to_dict(self):
@@ -86,19 +161,25 @@ class Config:
         if "FRENCH_MOVIES_DIR" in data: c.SPLIT_MOVIES_DIR = data["FRENCH_MOVIES_DIR"]
         for k, v in data.items():
             if hasattr(c, k): setattr(c, k, set(v) if isinstance(getattr(c, k), set) else v)
-        return c
-    def save(self, path: Path):
-        try:
-            with open(path, 'w') as f: json.dump(self.to_dict(), f, indent=4)
-        except Exception as e: logging.error(f"Failed to save config to '{path}': {e}")
+        c.refresh_derived(); return c
+    def save(self, path: Path) -> bool:
+        # One write into a sibling temp file, then an atomic rename: a crash mid-save can no longer leave a truncated config behind.
+        tmp = Path(path).with_name(Path(path).name + '.tmp')
+        try: tmp.write_text(json.dumps(self.to_dict(), indent=4)); os.replace(tmp, path); return True
+        except Exception as e:
+            logging.error(f"Failed to save config to '{path}': {e}")
+            try: tmp.unlink()
+            except OSError: pass
+            return False
     @classmethod
     def load(cls, path: Path):
-        if not path.exists(): return cls()
+        c = cls(); c._source_path = path
         try:
-            with open(path, 'r') as f: content = f.read()
-            if not content.strip(): return cls()
-            return cls.from_dict(json.loads(content))
-        except Exception as e: logging.error(f"Error loading config from '{path}': {e}. Loading defaults."); return cls()
+            content = path.read_bytes() # raw bytes go straight to the decoder (orjson when installed); a missing file is just the first run
+            if not content.strip(): return c
+            c = cls.from_dict(_json_loads(content)); c._source_path = path; return c
+        except FileNotFoundError: return c
+        except Exception as e: logging.error(f"Error loading config from '{path}': {e}. Loading defaults."); return c
     def validate(self) -> (bool, str):
         if self.API_PROVIDER == "omdb" and (not self.OMDB_API_KEY or self.OMDB_API_KEY == "yourkey"): return False, "Primary provider (OMDb) API key is not configured."
         if self.API_PROVIDER == "tmdb" and (not self.TMDB_API_KEY or self.TMDB_API_KEY == "yourkey"): return False, "Primary provider (TMDB) API key is not configured."
@@ -106,37 +187,109 @@ class Config:
         if not sd or not sd.exists(): return False, f"Source directory not found or not set: {sd}"
         return True, "Validation successful."
 
+@functools.lru_cache(maxsize=32)
+def _compile_custom_remover(strings: frozenset) -> Optional[re.Pattern]:
+    """One case-insensitive alternation for all custom strings, compiled once per distinct set."""
+    if not strings: return None
+    # Longest first: with entries like "WEB" and "WEB-DL", the shorter one would otherwise match and leave "-DL" behind.
+    return re.compile(r'\b(?:' + '|'.join(re.escape(s) for s in sorted(strings, key=lambda s: (-len(s), s))) + r')\b', re.IGNORECASE)
+
 class TitleCleaner:
-    METADATA_BREAKPOINT_PATTERN = re.compile(r'('r'\s[\(\[]?\d{4}[\)\]]?\b'r'|\s[Ss]\d{1,2}[Ee]\d{1,2}\b'r'|\s[Ss]\d{1,2}\b'r'|\sSeason\s\d{1,2}\b'r'|\s\d{3,4}p\b'r'|\s(WEBRip|BluRay|BDRip|DVDRip|HDRip|WEB-DL|HDTV)\b'r'|\s(x264|x265|H\.?264|H\.?265|HEVC|AVC)\b'r')', re.IGNORECASE)
+    METADATA_BREAKPOINT_PATTERN = re.compile(r'\s(?:[\(\[]?\d{4}[\)\]]?\b|[Ss]\d{1,2}(?:[Ee]\d{1,2})?\b|Season\s\d{1,2}\b|\d{3,4}p\b|(?:WEB(?:Rip|-DL)|BluRay|BDRip|DVDRip|HDRip|HDTV)\b|(?:x26[45]|H\.?26[45]|HEVC|AVC)\b)', re.IGNORECASE)
+    SEPARATOR_TRANS, BRACKET_PATTERN = str.maketrans('._', '  '), re.compile(r'\[[^\]]+\]')
+    # One run asks for the same names repeatedly (prefetch, classification, validation; every episode's season), so results are memoized.
+    @classmethod
+    def clean_for_search(cls, name: str, custom_strings: Set[str]) -> str: return cls._clean_for_search(name, frozenset(custom_strings))
     @classmethod
-    def clean_for_search(cls, name: str, custom_strings: Set[str]) -> str:
-        nws = re.sub(r'[\._]', ' ', name); tt = nws
-        for s in custom_strings: tt = re.sub(r'\b' + re.escape(s) + r'\b', ' ', tt, flags=re.IGNORECASE)
+    @functools.lru_cache(maxsize=4096)
+    def _clean_for_search(cls, name: str, custom_strings: frozenset) -> str:
+        tt = name.translate(cls.SEPARATOR_TRANS)
+        if cr := _compile_custom_remover(custom_strings): tt = cr.sub(' ', tt)
         tp = tt[:match.start()] if (match := cls.METADATA_BREAKPOINT_PATTERN.search(tt)) else tt
-        ct = re.sub(r'\[[^\]]+\]', '', tp); return re.sub(r'\s+', ' ', ct).strip()
+        # str.split() uses the same whitespace class as \s but collapses and strips in C, with no per-match Python callback.
+        return ' '.join(cls.BRACKET_PATTERN.sub('', tp).split())
+    # Anchored lookahead alternation: one search that still prefers SxxEyy over "Season N" over a bare Sxx anywhere in the name.
+    SEASON_PATTERN = re.compile(r'^(?:(?=.*?\b[Ss](\d{1,2})[Ee]\d{1,2}\b)|(?=.*?\bSeason[ _-]?(\d{1,2})\b)|(?=.*?\b[Ss](\d{1,2})\b))', re.IGNORECASE | re.DOTALL)
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def extract_season_info(cls, filename: str) -> Optional[int]:
-        for p in [r'\b[Ss](\d{1,2})[Ee]\d{1,2}\b', r'\bSeason[ _-]?(\d{1,2})\b', r'\b[Ss](\d{1,2})\b']:
-            if m:=re.search(p, filename, re.IGNORECASE): return int(m.group(1))
+        if m := cls.SEASON_PATTERN.search(filename): return int(next(g for g in m.groups() if g))
         return None
+    # "-" sits last in the separator classes: the old "[._- ]" was an invalid "_-space" range and made re raise on every call.
+    EPISODE_PATTERNS = (re.compile(r'[Ss]\d{1,2}[._ -]?[Ee](\d{1,3})\b', re.IGNORECASE), re.compile(r'\bEpisode[._ -]?(\d{1,3})\b', re.IGNORECASE))
+    YEAR_PATTERN = re.compile(r'\b(\d{4})\b')
     @classmethod
     def extract_episode_info(cls, filename: str) -> Optional[int]:
-        m = re.search(r'[Ss]\d{1,2}[._- ]?[Ee](\d{1,3})\b', filename, re.IGNORECASE)
-        if m: return int(m.group(1))
-        m = re.search(r'\bEpisode[._- ]?(\d{1,3})\b', filename, re.IGNORECASE)
-        if m: return int(m.group(1))
+        for p in cls.EPISODE_PATTERNS:
+            if m := p.search(filename): return int(m.group(1))
         return None
     @classmethod
     def extract_year(cls, filename: str) -> Optional[str]:
-        ms = re.findall(r'\b(\d{4})\b', filename)
+        ms = cls.YEAR_PATTERN.findall(filename)
         if not ms: return None
         cy = datetime.now().year; py = [m for m in ms if 1900 <= int(m) <= cy + 2]; return py[-1] if py else None
+    EPISODE_TAG_PATTERN, FANSUB_TAG_PATTERN = re.compile(r'\b[Ss]\d{1,2}[Ee]\d{1,3}\b'), re.compile(r'^\s*\[[^\]]+\]')
+    CJK_PATTERN = re.compile(r'[぀-ヿ㐀-䶿一-鿿가-힯]') # kana, CJK ideographs, hangul
+    @classmethod
+    def extract_signals(cls, name: str) -> Dict[str, Any]:
+        """Cheap filename hints for ordering API lookups: an SxxEyy tag, a plausible year, a leading [Group] fansub tag and CJK script."""
+        return {'has_seNN': cls.EPISODE_TAG_PATTERN.search(name) is not None, 'year': cls.extract_year(name),
+                'fansub': cls.FANSUB_TAG_PATTERN.match(name) is not None, 'cjk': cls.CJK_PATTERN.search(name) is not None}
+
+class RateLimiter:
+    """Spaces calls at least `interval` seconds apart, across threads."""
+    def __init__(self, interval: float): self.interval, self._next, self._lock = interval, 0.0, threading.Lock()
+    def wait(self):
+        with self._lock: now = monotonic(); t = max(now, self._next); self._next = t + self.interval
+        if t > now: sleep(t - now)
 
 class APIClient:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, use_cache: bool = True):
         self.config = config
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': 'SortMeDown/Engine/6.0.4'})
+        # One keep-alive pool per API host, sized to the lookup concurrency so TLS sessions are reused; transient 429/5xx answers are retried with backoff.
+        # AniList's GraphQL POSTs are read-only queries, so they are retried like the GETs (honouring Retry-After on 429).
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=frozenset({"GET", "POST"}), respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=API_MAX_CONCURRENCY, max_retries=retry)
+        self.session.mount("https://", adapter); self.session.mount("http://", adapter)
+        # Successful lookups are kept in a small SQLite file next to config.json so re-runs and watchdog passes skip the network.
+        self._cache, self._cache_lock, self._anilist_prefetch, self._anilist_pending = None, threading.Lock(), {}, {}
+        self._mem: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {} # (endpoint, key) -> (ts, body), bounded by API_MEMORY_CACHE_SIZE
+        self._limiters = {ep: RateLimiter(config.REQUEST_DELAY) for ep in ("omdb", "tmdb", "anilist")}; self._net_slots = threading.BoundedSemaphore(API_MAX_CONCURRENCY)
+        if use_cache and (cp := config.api_cache_path):
+            try:
+                self._cache = sqlite3.connect(os.fspath(cp), check_same_thread=False, isolation_level=None)
+                self._cache.execute("CREATE TABLE IF NOT EXISTS api_cache (endpoint TEXT, key TEXT, ts INTEGER, body TEXT, PRIMARY KEY (endpoint, key))")
+            except sqlite3.Error as e: logging.warning(f"API cache disabled, could not open '{cp}': {e}"); self._cache = None
+
+    def _remember(self, endpoint: str, key: str, ts: float, d: Dict[str, Any]):
+        with self._cache_lock:
+            if len(self._mem) >= API_MEMORY_CACHE_SIZE: self._mem.pop(next(iter(self._mem))) # evict the oldest insert
+            self._mem[(endpoint, key)] = (ts, d)
+    def _cache_get(self, endpoint: str, key: str) -> Optional[Dict[str, Any]]:
+        # Process-local layer first: watch-mode passes and repeated titles never touch SQLite or re-decode JSON.
+        if (hit := self._mem.get((endpoint, key))) and time() - hit[0] < API_CACHE_TTL: return hit[1]
+        if not self._cache: return None
+        try:
+            with self._cache_lock: row = self._cache.execute("SELECT ts, body FROM api_cache WHERE endpoint = ? AND key = ?", (endpoint, key)).fetchone()
+            if row and time() - row[0] < API_CACHE_TTL: d = _json_loads(row[1]); self._remember(endpoint, key, row[0], d); return d
+        except (sqlite3.Error, ValueError) as e: logging.warning(f"API cache read failed for '{key}': {e}")
+        return None
+    def _cache_put(self, endpoint: str, key: str, d: Dict[str, Any]):
+        self._remember(endpoint, key, time(), d)
+        if not self._cache: return
+        try:
+            with self._cache_lock: self._cache.execute("INSERT OR REPLACE INTO api_cache VALUES (?, ?, ?, ?)", (endpoint, key, int(time()), _json_dumps(d)))
+        except sqlite3.Error as e: logging.warning(f"API cache write failed for '{key}': {e}")
+
+    def _cached(self, endpoint: str, title: str, fetch: Callable[[str], Optional[Dict[str, Any]]], accept: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Optional[Dict[str, Any]]:
+        key = title.strip().lower()
+        if (d := self._cache_get(endpoint, key)) is not None and (accept is None or accept(d)): return d
+        self._limiters[endpoint].wait()
+        with self._net_slots: d = fetch(title)
+        if d is not None: self._cache_put(endpoint, key, d)
+        return d
     
     def test_omdb_api_key(self, api_key: str) -> Tuple[bool, str]:
         if not api_key or api_key == "yourkey": return False, "API key is empty or is the default key."
@@ -144,7 +297,7 @@ class APIClient:
         try:
             r = self.session.get(self.config.OMDB_URL, params=params, timeout=10)
             r.raise_for_status()
-            d = r.json()
+            d = _response_json(r)
             if d.get("Response") == "True": return True, "OMDb API Key is valid!"
             else: return False, f"OMDb Key is invalid: {d.get('Error', 'Unknown error')}"
         except requests.RequestException as e: return False, f"Network request failed: {e}"
@@ -159,28 +312,87 @@ class APIClient:
             else: r.raise_for_status(); return False, f"TMDB returned status {r.status_code}"
         except requests.RequestException as e: return False, f"Network request failed: {e}"
 
+    def _omdb_needs_detail(self) -> bool:
+        # Search hits lack Language/Genre/Country, which only the language split and the anime cross-check read.
+        c = self.config; return bool(c.LANGUAGES_TO_SPLIT and c.SPLIT_MOVIES_DIR) or c.ANIME_MOVIES_ENABLED or c.ANIME_SERIES_ENABLED
+    def close(self):
+        """Closes the cache connection and the HTTP pool; a later lookup goes to the network uncached."""
+        with self._cache_lock:
+            if self._cache: self._cache.close(); self._cache = None
+        self.session.close()
+
     def query_omdb(self, title: str) -> Optional[Dict[str, Any]]:
+        if not self._omdb_needs_detail(): return self._cached("omdb", title, functools.partial(self._fetch_omdb, detail=False))
+        return self._cached("omdb", title, self._fetch_omdb, accept=lambda d: not d.get("_summary"))
+    def query_tmdb(self, title: str) -> Optional[Dict[str, Any]]: return self._cached("tmdb", title, self._fetch_tmdb)
+    def query_anilist(self, title: str) -> Optional[Dict[str, Any]]:
+        key = title.strip().lower()
+        if (ev := self._anilist_pending.get(key)) is not None: ev.wait() # its batch is in flight; one request already covers it
+        if key in self._anilist_prefetch: return self._anilist_prefetch[key]
+        return self._cached("anilist", title, self._fetch_anilist)
+
+    def prefetch_anilist(self, titles: List[str], wait: bool = True, stop: Optional[threading.Event] = None) -> Optional[threading.Thread]:
+        """Resolves many titles up front, ANILIST_BATCH_SIZE per request, so query_anilist can answer from memory during the run.
+        With wait=False the batches run on a background thread while other hosts are queried; query_anilist blocks only on its own batch.
+        Once `stop` is set no further batch is sent."""
+        store, waits, pending = {}, {}, {}
+        self._anilist_prefetch, self._anilist_pending = store, waits
+        for t in titles:
+            if not (k := t.strip().lower()) or k in store or k in pending: continue
+            if (hit := self._cache_get("anilist", k)) is not None: store[k] = hit
+            else: pending[k] = t
+        todo = list(pending.values())
+        batches = [(todo[i:i + ANILIST_BATCH_SIZE], threading.Event()) for i in range(0, len(todo), ANILIST_BATCH_SIZE)]
+        for b, ev in batches: waits.update(dict.fromkeys((t.strip().lower() for t in b), ev))
+        def _run():
+            try:
+                for b, ev in batches:
+                    if stop is not None and stop.is_set(): break
+                    try: store.update(self.query_anilist_batch(b))
+                    finally: ev.set() # a failed batch leaves its titles to the per-title fallback
+            finally:
+                for _, ev in batches: ev.set() # batches skipped after a stop must not leave a lookup waiting
+        if wait or not batches: _run(); return None
+        th = threading.Thread(target=_run, name="smd-anilist-prefetch", daemon=True); th.start(); return th
+
+    def query_anilist_batch(self, titles: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """One GraphQL request with an aliased Media() selection per title; maps each lowercased title to its match or None."""
+        q = "query (" + ", ".join(f"$s{i}: String" for i in range(len(titles))) + ") { " + " ".join(f"m{i}: Media(search: $s{i}, type: ANIME) {{ {ANILIST_MEDIA_FIELDS} }}" for i in range(len(titles))) + " }"
+        self._limiters["anilist"].wait()
+        try:
+            with self._net_slots: r = self.session.post(self.config.ANILIST_URL, json={"query": q, "variables": {f"s{i}": t for i, t in enumerate(titles)}}, timeout=20)
+            # AniList answers 404 with partial data when some aliases have no match; only a missing "data" block is a failure.
+            if (data := _response_json(r).get("data")) is None: r.raise_for_status(); return {}
+        except (requests.RequestException, ValueError) as e: logging.error(f"AniList batch request failed for {len(titles)} titles: {e}"); return {}
+        out = {}
+        for i, t in enumerate(titles):
+            out[k := t.strip().lower()] = m = data.get(f"m{i}")
+            if m: self._cache_put("anilist", k, m)
+        return out
+
+    def _fetch_omdb(self, title: str, detail: bool = True) -> Optional[Dict[str, Any]]:
         try:
             for p in [{"t": title}, {"s": title}]:
                 fp = {**p, "apikey": self.config.OMDB_API_KEY}
                 r = self.session.get(self.config.OMDB_URL, params=fp, timeout=10)
                 r.raise_for_status()
-                d = r.json()
+                d = _response_json(r)
                 if d.get("Response") == "True":
                     if "Search" in d:
+                        if not detail: return {**d["Search"][0], "_summary": True}
                         id_p = {"i": d["Search"][0]["imdbID"], "apikey": self.config.OMDB_API_KEY}
                         id_r = self.session.get(self.config.OMDB_URL, params=id_p, timeout=10)
-                        return id_r.json()
+                        return _response_json(id_r)
                     return d
         except requests.RequestException as e: logging.error(f"OMDb API request failed for '{title}': {e}")
         return None
 
-    def query_tmdb(self, title: str) -> Optional[Dict[str, Any]]:
+    def _fetch_tmdb(self, title: str) -> Optional[Dict[str, Any]]:
         try:
             sp = {"api_key": self.config.TMDB_API_KEY, "query": title}
             sr = self.session.get(f"{self.config.TMDB_URL}/search/multi", params=sp, timeout=10)
             sr.raise_for_status()
-            sd = sr.json()
+            sd = _response_json(sr)
             if not sd.get("results"): return None
             fr = sd["results"][0]
             mt, mid = fr.get("media_type"), fr.get("id")
@@ -188,16 +400,16 @@ class APIClient:
             dp = {"api_key": self.config.TMDB_API_KEY, "append_to_response": "credits,translations"}
             dr = self.session.get(f"{self.config.TMDB_URL}/{mt}/{mid}", params=dp, timeout=10)
             dr.raise_for_status()
-            return dr.json()
+            return _response_json(dr)
         except requests.RequestException as e: logging.error(f"TMDB API request failed for '{title}': {e}")
         return None
 
-    def query_anilist(self, title: str) -> Optional[Dict[str, Any]]:
-        q = '''query ($search: String) { Media(search: $search, type: ANIME) { title { romaji english native } format, genres, season, seasonYear, episodes } }'''
+    def _fetch_anilist(self, title: str) -> Optional[Dict[str, Any]]:
+        q = f"query ($search: String) {{ Media(search: $search, type: ANIME) {{ {ANILIST_MEDIA_FIELDS} }} }}"
         try:
             r = self.session.post(self.config.ANILIST_URL, json={"query": q, "variables": {"search": title}}, timeout=10)
             r.raise_for_status()
-            m = r.json().get("data", {}).get("Media")
+            m = _response_json(r).get("data", {}).get("Media")
             if m: logging.info(f"AniList found match for: {title}"); return m
         except requests.RequestException as e: logging.error(f"AniList API request failed for '{title}': {e}")
         return None
@@ -213,11 +425,12 @@ class MediaClassifier:
             return MediaInfo(title=name, year=None, media_type=MediaType.UNKNOWN, language=None, genre=None)
         
         logging.info(f"Classifying: '{name}' -> Clean search: '{clean_name}'")
-        cfg = self.api_client.config
-        anilist_data = None
-        if cfg.ANIME_MOVIES_ENABLED or cfg.ANIME_SERIES_ENABLED:
-            anilist_data = self.api_client.query_anilist(clean_name)
-            sleep(cfg.REQUEST_DELAY)
+        cfg, sig = self.api_client.config, TitleCleaner.extract_signals(name)
+        anime_on, anilist_data = cfg.ANIME_MOVIES_ENABLED or cfg.ANIME_SERIES_ENABLED, None
+        if anime_on and (sig['fansub'] or sig['cjk']):
+            # A leading [Group] tag or a Japanese/CJK title is almost always anime: AniList decides on a hit and the movie/TV providers are not asked.
+            if anilist_data := self.api_client.query_anilist(clean_name): return self._classify_from_anilist(anilist_data)
+            anime_on = False
 
         pp, sp = cfg.API_PROVIDER, "tmdb" if cfg.API_PROVIDER == "omdb" else "omdb"
         sa = (sp == 'omdb' and cfg.OMDB_API_KEY and cfg.OMDB_API_KEY != 'yourkey') or \
@@ -229,14 +442,12 @@ class MediaClassifier:
 
         if mad is None and sa:
             logging.warning(f"Primary provider '{pp.upper()}' failed. Trying fallback '{sp.upper()}'.")
-            sleep(cfg.REQUEST_DELAY)
             qfs = getattr(self.api_client, f"query_{sp}")
             mad = qfs(clean_name)
             if mad: pp = sp
-            
-        if anilist_data:
-            if mad and pp == 'omdb' and "animation" not in mad.get("Genre", "").lower() and "japan" not in mad.get("Country", "").lower():
-                return self._classify_from_omdb(mad)
+
+        # AniList is only asked when the main result could be animation; a clearly live-action match stands on its own.
+        if anime_on and not (mad and self._clearly_not_anime(mad, pp, sig)) and (anilist_data := self.api_client.query_anilist(clean_name)):
             return self._classify_from_anilist(anilist_data)
         
         if mad: return self._classify_from_main_api(mad, pp)
@@ -244,6 +455,12 @@ class MediaClassifier:
         logging.warning(f"No API results found for: {clean_name}")
         return MediaInfo(title=name, year=None, media_type=MediaType.UNKNOWN, language=None, genre=None)
 
+    @staticmethod
+    def _clearly_not_anime(mad: Dict[str, Any], pp: str, sig: Dict[str, Any]) -> bool:
+        if pp == 'omdb': return "animation" not in mad.get("Genre", "").lower() and "japan" not in mad.get("Country", "").lower()
+        # TMDB: only an SxxEyy-tagged file matched to a non-animated TV show is trusted without asking AniList.
+        return sig['has_seNN'] and "name" in mad and not any(g.get("name") == "Animation" for g in mad.get("genres", []))
+
     def _classify_from_main_api(self, data: Dict[str, Any], p: str) -> MediaInfo:
         if p == "omdb": return self._classify_from_omdb(data)
         if p == "tmdb": return self._classify_from_tmdb(data)
@@ -273,33 +490,61 @@ class MediaClassifier:
         return MediaInfo(title=t, year=y, media_type=mt, language=lang, genre=g)
 
 class FileManager:
-    def __init__(self, cfg: Config, dry_run: bool): self.cfg, self.dry_run = cfg, dry_run
+    def __init__(self, cfg: Config, dry_run: bool): self.cfg, self.dry_run, self._same_dev, self.vacated_dirs, self._ensured_dirs = cfg, dry_run, {}, set(), set() # vacated_dirs: parents files were moved out of
     def _find_sidecar_files(self, pf: Path) -> List[Path]:
-        s, st = [], pf.stem
-        for sib in pf.parent.iterdir():
-            if sib != pf and sib.stem == st and sib.suffix.lower() in self.cfg.SIDECAR_EXTENSIONS: s.append(sib)
+        # Names come straight from the dirents; a Path is only built for actual matches.
+        s, st, exts, pn = [], pf.stem, self.cfg.sidecar_ext_set, pf.name
+        with os.scandir(pf.parent) as it:
+            for e in it:
+                stem, sfx = os.path.splitext(e.name)
+                if stem == st and sfx.lower() in exts and e.name != pn: s.append(Path(e.path))
         return s
+    def reset_run_state(self): self.vacated_dirs.clear(); self._ensured_dirs.clear()
     def ensure_dir(self, p: Path) -> bool:
         if not p: logging.error("Destination directory path is not set."); return False
+        if p in self._ensured_dirs: return True # every episode of a season lands in the same folder; stat it once per run
         if not p.exists():
             if self.dry_run: logging.info(f"DRY RUN: Would create dir '{p}'")
             else:
                 try: p.mkdir(parents=True, exist_ok=True)
                 except Exception as e: logging.error(f"Could not create directory '{p}': {e}"); return False
-        return True
+        self._ensured_dirs.add(p); return True
+    @staticmethod
+    def _same_file(a: Path, b: Path) -> bool:
+        try: return os.path.samefile(a, b)
+        except OSError: return False
+    def _move(self, src: Path, dd: Path, t: Path):
+        """Moves src to t without ever overwriting; raises FileExistsError if t is taken."""
+        # A rename is a single syscall on one volume; only cross-device moves need shutil's copy+delete.
+        # The device check is cached per (source folder, destination) pair, so a season of episodes costs two stats in total.
+        if (same := self._same_dev.get(key := (src.parent, dd))) is None: same = self._same_dev[key] = os.stat(src.parent).st_dev == os.stat(dd).st_dev
+        s, d = os.fspath(src), os.fspath(t)
+        # Windows' rename refuses an existing target by itself; POSIX rename and shutil's copy fallback would silently clobber it.
+        if not (same and os.name == 'nt') and os.path.lexists(d): raise FileExistsError(errno.EEXIST, "Target already exists", d)
+        if same:
+            try: os.rename(s, d); return
+            except OSError as e:
+                if e.errno != errno.EXDEV: raise
+                self._same_dev[key] = False # bind mounts can share st_dev yet refuse a rename
+        # Cross-device: shutil's copy already runs in-kernel (sendfile on Linux, fcopyfile on macOS) and clones are impossible across volumes.
+        shutil.move(s, d)
     def move_file_group(self, fg: List[Path], dd: Path) -> bool:
         if not self.ensure_dir(dd): return False
         pf, all_ok = fg[0], True
         for ftm in fg:
-            t = dd / ftm.name
-            if str(ftm.resolve()) == str(t.resolve()): logging.info(f"Skipping move: '{ftm.name}' is already in correct location."); continue
-            if t.exists(): logging.warning(f"SKIPPED: File '{t.name}' already exists in '{dd.name}'."); continue
-            lp = "DRY RUN:" if self.dry_run else "Moved"
-            if ftm != pf: lp += " (sidecar)"
-            logging.info(f"{lp}: '{ftm.name}' -> '{dd.name}'")
-            if not self.dry_run:
-                try: shutil.move(str(ftm), str(t))
-                except Exception as e: logging.error(f"ERROR moving file '{ftm.name}': {e}"); all_ok = False
+            t, sc = dd / ftm.name, " (sidecar)" if ftm != pf else ""
+            # Same parent means same file without touching the disk; otherwise only an existing target can alias ftm (symlinked dirs etc.).
+            if ftm.parent == dd: logging.info(f"Skipping move: '{ftm.name}' is already in correct location."); continue
+            try:
+                if self.dry_run:
+                    if t.exists(): raise FileExistsError(errno.EEXIST, "Target already exists", os.fspath(t))
+                    logging.info(f"DRY RUN:{sc}: '{ftm.name}' -> '{dd.name}'"); continue
+                # The existence check lives inside _move, next to the rename it guards, instead of a separate stat per file here.
+                self._move(ftm, dd, t); self.vacated_dirs.add(ftm.parent); logging.info(f"Moved{sc}: '{ftm.name}' -> '{dd.name}'")
+            except FileExistsError:
+                if self._same_file(ftm, t): logging.info(f"Skipping move: '{ftm.name}' is already in correct location.")
+                else: logging.warning(f"SKIPPED: File '{t.name}' already exists in '{dd.name}'.")
+            except Exception as e: logging.error(f"ERROR moving file '{ftm.name}': {e}"); all_ok = False
         return all_ok
     def delete_file_group(self, pf: Path):
         fg = [pf] + self._find_sidecar_files(pf)
@@ -310,23 +555,78 @@ class FileManager:
                 else: os.remove(ftd); logging.info(f"Deleted file: {ftd.name}")
             except Exception as e: logging.error(f"Failed to delete file '{ftd.name}': {e}")
                 
+class _ChangeHandler(FileSystemEventHandler):
+    def __init__(self, changed: threading.Event, ignore: Optional[Path]): super().__init__(); self.changed, self.ignore = changed, str(ignore) if ignore else None
+    def _hit(self, path: str):
+        # Compared up to a separator, so a sibling such as '_Mismatched Anime' is not mistaken for the ignored folder.
+        if not (self.ignore and (path == self.ignore or path.startswith(self.ignore + os.sep))): self.changed.set()
+    def on_created(self, event): self._hit(event.src_path)
+    def on_moved(self, event): self._hit(event.dest_path)
+
 class DirectoryWatcher:
-    def __init__(self, config: Config): self.config, self.last_mtime = config, 0; self._scan()
+    def __init__(self, config: Config): self.config, self.last_mtime, self._sd_raw, self._sd, self._observer, self.changed = config, 0, None, None, None, threading.Event(); self._scan()
+    def start(self, ignore: Optional[Path] = None) -> bool:
+        """Subscribes to file events under the source dir; False means watchdog is unavailable and callers should poll."""
+        if Observer is None or not (sd := self._source_dir()) or not sd.exists(): return False
+        try: obs = Observer(); obs.schedule(_ChangeHandler(self.changed, ignore), str(sd), recursive=True); obs.daemon = True; obs.start()
+        except Exception as e: logging.warning(f"File notifications unavailable ({e}); falling back to polling."); return False
+        self._observer = obs; return True
+    def stop(self):
+        if self._observer: self._observer.stop(); self._observer.join(timeout=5); self._observer = None
+    def wait_for_changes(self, stop_event: threading.Event) -> bool:
+        """Blocks until a burst of file events has settled for WATCH_DEBOUNCE seconds, or stop_event is set."""
+        while not stop_event.is_set():
+            if self.changed.wait(1):
+                self.changed.clear()
+                while not stop_event.is_set() and self.changed.wait(WATCH_DEBOUNCE): self.changed.clear()
+                return not stop_event.is_set()
+        return False
+    def _source_dir(self) -> Optional[Path]:
+        # Rebuild the Path only when SOURCE_DIR is edited, not on every poll.
+        if (raw := self.config.SOURCE_DIR) != self._sd_raw: self._sd_raw, self._sd = raw, self.config.get_path('SOURCE_DIR')
+        return self._sd
     def _scan(self):
-        if (sd := self.config.get_path('SOURCE_DIR')) and sd.exists(): self.last_mtime = sd.stat().st_mtime
+        if (sd := self._source_dir()) and sd.exists(): self.last_mtime = sd.stat().st_mtime
     def check_for_changes(self) -> bool:
-        if (sd := self.config.get_path('SOURCE_DIR')) and sd.exists():
+        if (sd := self._source_dir()) and sd.exists():
             mt = sd.stat().st_mtime
             if mt > self.last_mtime: self.last_mtime = mt; return True
         return False
         
 class MediaSorter:
-    def __init__(self, cfg: Config, dry_run: bool = False, progress_callback: Optional[Callable[[int, int], None]] = None):
-        self.cfg, self.dry_run, self.progress_callback = cfg, dry_run, progress_callback
+    # MediaType -> (Config enable flag, stats key, sorted into "Season NN" subfolders)
+    _ROUTES = {MediaType.MOVIE: ('MOVIES_ENABLED', 'movies', False), MediaType.TV_SERIES: ('TV_SHOWS_ENABLED', 'tv', True),
+               MediaType.ANIME_MOVIE: ('ANIME_MOVIES_ENABLED', 'anime_movies', False), MediaType.ANIME_SERIES: ('ANIME_SERIES_ENABLED', 'anime_series', True)}
+    def __init__(self, cfg: Config, dry_run: bool = False, progress_callback: Optional[Callable[[int, int], None]] = None, status_callback: Optional[Callable[[bool], None]] = None):
+        self.cfg, self.dry_run, self.progress_callback, self.status_callback = cfg, dry_run, progress_callback, status_callback
         self.api_client = APIClient(cfg); self.classifier = MediaClassifier(self.api_client); self.fm = FileManager(cfg, dry_run)
-        self.stats, self.stop_event, self.is_processing = {}, threading.Event(), False
+        self.stats, self.stop_event, self._is_processing, self._stats_lock = {}, threading.Event(), False, threading.Lock()
+        self._sidecar_index: Optional[Dict[Tuple[Path, str], List[Path]]] = None # (parent, stem) -> sidecars, only during a source-directory run
+        self._dests: Optional[Dict[Any, Optional[Path]]] = None # built once per source-directory run; single sorts build their own
+        self._classify_cache: Dict[str, Tuple[str, MediaInfo]] = {}; self._classify_locks: Dict[str, threading.Lock] = {} # keyed by cleaned name, reset per run
+
+    @property
+    def is_processing(self) -> bool: return self._is_processing
+    @is_processing.setter
+    def is_processing(self, value: bool):
+        # Front-ends are told when a run starts or stops instead of having to poll this flag.
+        changed = value != self._is_processing; self._is_processing = value
+        if changed and self.status_callback: self.status_callback(value)
         
+    def _bump(self, key: str, delta: int = 1):
+        with self._stats_lock: self.stats[key] = self.stats.get(key, 0) + delta
+
     def signal_stop(self): self.stop_event.set(); logging.info("Stop signal received. Finishing current item...")
+    def close(self): self.api_client.close()
+
+    def _classify(self, name: str) -> MediaInfo:
+        # Episodes of one show classify by the same folder name; the per-key lock lets concurrent workers share a single API lookup.
+        cs = self.cfg.custom_strings_set
+        if not (key := TitleCleaner.clean_for_search(name, cs)): return self.classifier.classify_media(name, cs)
+        with self._classify_locks.setdefault(key, threading.Lock()):
+            if (hit := self._classify_cache.get(key)) is None: self._classify_cache[key] = (name, info := self.classifier.classify_media(name, cs)); return replace(info)
+        # Copies, since callers adjust the result in place; an UNKNOWN result echoes the raw name it was asked about.
+        src, info = hit; return replace(info, title=name) if info.media_type == MediaType.UNKNOWN and src != name else replace(info)
     
     def force_move_item(self, item: Path, folder_name: str, media_type: MediaType, is_split_lang_override: bool = False):
         logging.info(f"FORCE MOVE: Manually classifying '{item.name}' as {media_type.value} into folder '{folder_name}'.")
@@ -335,11 +635,22 @@ class MediaSorter:
                     MediaType.ANIME_MOVIE: self.cfg.get_path('ANIME_MOVIES_DIR'), MediaType.ANIME_SERIES: self.cfg.get_path('ANIME_SERIES_DIR')}.get(media_type)
         if media_type == MediaType.MOVIE and is_split_lang_override and self.cfg.SPLIT_MOVIES_DIR: base_dir = self.cfg.get_path('SPLIT_MOVIES_DIR'); logging.info("Split language movie override selected.")
         if not base_dir: logging.error(f"Target directory for {media_type.value} is not set. Cannot force move."); return
-        clean_folder_name = re.sub(r'[<>:"/\\|?*]', '', folder_name).strip()
+        clean_folder_name = folder_name.translate(_FORBIDDEN_FS_CHARS).strip()
         dest_folder = base_dir / clean_folder_name
         if media_type in [MediaType.TV_SERIES, MediaType.ANIME_SERIES]: dest_folder = dest_folder / f"Season {TitleCleaner.extract_season_info(item.name) or 1:02d}"
         self.fm.move_file_group(files_to_move, dest_folder)
 
+    def _sidecars_for(self, item: Path) -> List[Path]:
+        # During a full run the walk already saw every sidecar; entries are popped so a moved group is never offered twice.
+        if self._sidecar_index is None: return self.fm._find_sidecar_files(item)
+        return self._sidecar_index.pop((item.parent, item.stem), [])
+
+    def _destinations(self) -> Dict[Any, Optional[Path]]:
+        """Target roots keyed by MediaType, plus 'split' and 'mismatched'."""
+        g = self.cfg.get_path
+        return {MediaType.MOVIE: g('MOVIES_DIR'), MediaType.TV_SERIES: g('TV_SHOWS_DIR'), MediaType.ANIME_MOVIE: g('ANIME_MOVIES_DIR'),
+                MediaType.ANIME_SERIES: g('ANIME_SERIES_DIR'), 'split': g('SPLIT_MOVIES_DIR'), 'mismatched': self._get_mismatched_path()}
+
     def _get_mismatched_path(self) -> Optional[Path]:
         if p := self.cfg.get_path('MISMATCHED_DIR'): return p
         if sp := self.cfg.get_path('SOURCE_DIR'): return sp / '_Mismatched'
@@ -364,80 +675,78 @@ class MediaSorter:
         year_in_file = TitleCleaner.extract_year(file_path.name) or TitleCleaner.extract_year(term)
         if year_in_file and info.year and year_in_file != info.year:
             logging.warning(f"CONFLICT: Filename year '{year_in_file}' mismatches API year '{info.year}'. Reverting to safe fallback.")
-            clean_title = TitleCleaner.clean_for_search(term, self.cfg.CUSTOM_STRINGS_TO_REMOVE)
+            clean_title = TitleCleaner.clean_for_search(term, self.cfg.custom_strings_set)
             info.media_type, info.title, info.year = MediaType.UNKNOWN, clean_title, year_in_file
         return info
         
-    def sort_item(self, item: Path, override_name: Optional[str] = None):
-        if item.suffix.lower() in self.cfg.SIDECAR_EXTENSIONS: return
+    def sort_item(self, item: Path, override_name: Optional[str] = None, source_dir: Optional[Path] = None, suffix: Optional[str] = None):
+        if (suffix if suffix is not None else item.suffix.lower()) in self.cfg.sidecar_ext_set: return
+        self._place_item(item, self._identify_item(item, override_name, source_dir))
+
+    def _identify_item(self, item: Path, override_name: Optional[str] = None, source_dir: Optional[Path] = None) -> MediaInfo:
+        """API-bound half of sort_item: safe to run for many items at once."""
         initial_info, search_term = None, None
         if override_name:
-            search_term, initial_info = override_name, self.classifier.classify_media(override_name, self.cfg.CUSTOM_STRINGS_TO_REMOVE)
+            search_term, initial_info = override_name, self._classify(override_name)
         else:
-            is_sub = item.parent != self.cfg.get_path('SOURCE_DIR')
+            is_sub = item.parent != (source_dir or self.cfg.get_path('SOURCE_DIR'))
             p_name = item.parent.name if is_sub else item.stem; search_term = p_name
-            initial_info = self.classifier.classify_media(p_name, self.cfg.CUSTOM_STRINGS_TO_REMOVE)
+            initial_info = self._classify(p_name)
             if initial_info.media_type == MediaType.UNKNOWN and is_sub and (s_name := item.stem).lower() != p_name.lower():
                 logging.warning(f"Folder search for '{p_name}' failed. Trying filename: '{s_name}'")
-                fb_info = self.classifier.classify_media(s_name, self.cfg.CUSTOM_STRINGS_TO_REMOVE)
+                fb_info = self._classify(s_name)
                 if fb_info.media_type != MediaType.UNKNOWN: logging.info("Filename fallback successful."); initial_info, search_term = fb_info, s_name
                 else: logging.warning(f"Filename fallback for '{s_name}' also failed.")
         
-        info = self._validate_api_result(item, search_term, initial_info)
-        files_to_move = [item] + self.fm._find_sidecar_files(item)
-        s = self.stats; logging.info(f"Class: {info.media_type.value} | Title: '{info.get_folder_name()}'" + (f" | Found {len(files_to_move) - 1} sidecars." if len(files_to_move) > 1 else ""))
+        return self._validate_api_result(item, search_term, initial_info)
+
+    def _place_item(self, item: Path, info: MediaInfo):
+        """Filesystem half of sort_item; full runs call it from one thread so existence checks and moves never race."""
+        files_to_move, folder_name, dests = [item] + self._sidecars_for(item), info.get_folder_name(), self._dests or self._destinations()
+        logging.info(f"Class: {info.media_type.value} | Title: '{folder_name}'" + (f" | Found {len(files_to_move) - 1} sidecars." if len(files_to_move) > 1 else ""))
         
         if info.media_type == MediaType.UNKNOWN:
-            s['unknown'] += 1;
+            self._bump('unknown')
             if self.cfg.CLEANUP_MODE_ENABLED: logging.warning("Skipping fallback for UNKNOWN in Cleanup Mode."); return
-            mpath = self._get_mismatched_path()
-            if not mpath: logging.error("Mismatched dir not set. Skipping."); s['errors'] += 1; return
+            mpath = dests['mismatched']
+            if not mpath: logging.error("Mismatched dir not set. Skipping."); self._bump('errors'); return
             is_series = TitleCleaner.extract_season_info(item.name) is not None
             if is_series:
                 fdest = self.cfg.FALLBACK_SHOW_DESTINATION
                 if fdest == "ignore": logging.info("Mismatched series set to 'ignore'."); return
                 logging.info(f"Mismatched series routing to '{fdest}' destination.")
-                dmap = {"tv": self.cfg.get_path('TV_SHOWS_DIR'), "anime": self.cfg.get_path('ANIME_SERIES_DIR'), "mismatched": mpath}
+                dmap = {"tv": dests[MediaType.TV_SERIES], "anime": dests[MediaType.ANIME_SERIES], "mismatched": mpath}
                 bdir = dmap.get(fdest)
-                if not bdir: logging.error(f"Fallback dir '{fdest}' not set."); s['errors'] += 1; return
-                df = bdir / info.get_folder_name() / f"Season {TitleCleaner.extract_season_info(item.name) or 1:02d}"
-                if self.fm.move_file_group(files_to_move, df): s['unknown'] -=1; s['tv' if fdest == 'tv' else 'anime_series' if fdest == 'anime' else 'unknown'] +=1
-                else: s['errors'] += 1
+                if not bdir: logging.error(f"Fallback dir '{fdest}' not set."); self._bump('errors'); return
+                df = bdir / folder_name / f"Season {TitleCleaner.extract_season_info(item.name) or 1:02d}"
+                if self.fm.move_file_group(files_to_move, df): self._bump('unknown', -1); self._bump('tv' if fdest == 'tv' else 'anime_series' if fdest == 'anime' else 'unknown')
+                else: self._bump('errors')
             else:
                 logging.info("Unidentified item is not a series. Routing to Mismatched folder.")
-                df = mpath / info.get_folder_name()
-                if self.fm.move_file_group(files_to_move, df): s['unknown'] -=1; s['movies'] += 1
-                else: s['errors'] += 1
+                df = mpath / folder_name
+                if self.fm.move_file_group(files_to_move, df): self._bump('unknown', -1); self._bump('movies')
+                else: self._bump('errors')
             return
             
-        if not {MediaType.MOVIE: self.cfg.MOVIES_ENABLED, MediaType.TV_SERIES: self.cfg.TV_SHOWS_ENABLED,
-                MediaType.ANIME_MOVIE: self.cfg.ANIME_MOVIES_ENABLED, MediaType.ANIME_SERIES: self.cfg.ANIME_SERIES_ENABLED}.get(info.media_type, True):
+        if (route := self._ROUTES.get(info.media_type)) and not getattr(self.cfg, route[0]):
             logging.info(f"Skipping {info.media_type.value} sort (disabled)."); return
 
-        base_dir = item.parent if self.cfg.CLEANUP_MODE_ENABLED else {MediaType.MOVIE: self.cfg.get_path('MOVIES_DIR'), MediaType.TV_SERIES: self.cfg.get_path('TV_SHOWS_DIR'),
-                      MediaType.ANIME_MOVIE: self.cfg.get_path('ANIME_MOVIES_DIR'), MediaType.ANIME_SERIES: self.cfg.get_path('ANIME_SERIES_DIR')}.get(info.media_type)
+        base_dir = item.parent if self.cfg.CLEANUP_MODE_ENABLED else dests.get(info.media_type)
         
-        if info.media_type == MediaType.MOVIE and self.cfg.get_path('SPLIT_MOVIES_DIR') and self.cfg.LANGUAGES_TO_SPLIT and not self.cfg.CLEANUP_MODE_ENABLED:
+        if info.media_type == MediaType.MOVIE and dests['split'] and self.cfg.LANGUAGES_TO_SPLIT and not self.cfg.CLEANUP_MODE_ENABLED:
             movie_langs = {l.strip().lower() for l in (info.language or "").split(',')}
             split_langs = {l.strip().lower() for l in self.cfg.LANGUAGES_TO_SPLIT}
             should_split = "all" in split_langs and "english" not in movie_langs or not movie_langs.isdisjoint(split_langs)
-            if should_split: logging.info(f"🔵⚪🔴 Movie language '{info.language}' matches split rule."); base_dir = self.cfg.get_path('SPLIT_MOVIES_DIR')
+            if should_split: logging.info(f"🔵⚪🔴 Movie language '{info.language}' matches split rule.", extra={"tag": "FRENCH"}); base_dir = dests['split']
                 
-        if not base_dir: logging.error(f"Target dir for {info.media_type.value} not set."); s['errors'] += 1; return
-            
-        if info.media_type in [MediaType.MOVIE, MediaType.ANIME_MOVIE]:
-            key = 'anime_movies' if info.media_type == MediaType.ANIME_MOVIE else 'movies'
-            if base_dir == self.cfg.get_path('SPLIT_MOVIES_DIR'): key = 'split_lang_movies'
-            dest_folder = base_dir / info.get_folder_name()
-            if self.cfg.CLEANUP_MODE_ENABLED and dest_folder.resolve() == item.parent.resolve(): logging.info(f"Skipping move, '{item.name}' is already in the correct folder."); s[key] = s.get(key, 0) + 1; return
-            if self.fm.move_file_group(files_to_move, dest_folder): s[key] = s.get(key, 0) + 1
-            else: s['errors'] += 1
-        elif info.media_type in [MediaType.TV_SERIES, MediaType.ANIME_SERIES]:
-            key = 'anime_series' if info.media_type == MediaType.ANIME_SERIES else 'tv'
-            dest_folder = base_dir / info.get_folder_name() / f"Season {TitleCleaner.extract_season_info(item.name) or 1:02d}"
-            if self.cfg.CLEANUP_MODE_ENABLED and dest_folder.resolve() == item.parent.resolve(): logging.info(f"Skipping move, '{item.name}' is already in correct folder."); s[key] += 1; return
-            if self.fm.move_file_group(files_to_move, dest_folder): s[key] += 1
-            else: s['errors'] += 1
+        if not base_dir: logging.error(f"Target dir for {info.media_type.value} not set."); self._bump('errors'); return
+        if not route: return
+        _, key, is_series = route
+        if is_series: dest_folder = base_dir / folder_name / f"Season {TitleCleaner.extract_season_info(item.name) or 1:02d}"
+        else: dest_folder = base_dir / folder_name; key = 'split_lang_movies' if base_dir == dests['split'] else key
+        if self.cfg.CLEANUP_MODE_ENABLED and dest_folder.resolve() == item.parent.resolve(): logging.info(f"Skipping move, '{item.name}' is already in the correct folder."); self._bump(key); return
+        if self.fm.move_file_group(files_to_move, dest_folder): self._bump(key)
+        else: self._bump('errors')
 
     # --- START: CORRECTED Reorganize Methods ---
     def reorganize_folder_structure(self, target_path: Path, file_list: Optional[List[Path]] = None):
@@ -455,7 +764,7 @@ class MediaSorter:
             files_to_process = file_list
             if not files_to_process:
                 logging.info("No specific files selected, scanning entire directory...")
-                files_to_process = [p for ext in self.cfg.SUPPORTED_EXTENSIONS for p in target_path.glob(f'**/*{ext}') if p.is_file()]
+                files_to_process = sorted(iter_files(target_path, self.cfg.ext_tuple), key=str)
 
             total_files = len(files_to_process)
             if self.progress_callback: self.progress_callback(0, total_files)
@@ -466,7 +775,7 @@ class MediaSorter:
                 
                 try:
                     logging.info(f"Analyzing: '{item.relative_to(target_path)}'")
-                    info = self.classifier.classify_media(item.stem, self.cfg.CUSTOM_STRINGS_TO_REMOVE)
+                    info = self.classifier.classify_media(item.stem, self.cfg.custom_strings_set)
                     if info.media_type == MediaType.UNKNOWN:
                         logging.warning(f"SKIPPED: Could not identify '{item.name}', cannot determine destination folder.")
                         continue
@@ -509,7 +818,7 @@ class MediaSorter:
             files_to_process = file_list
             if not files_to_process:
                 logging.info("No specific files selected, scanning entire directory...")
-                files_to_process = [p for ext in self.cfg.SUPPORTED_EXTENSIONS for p in target_path.glob(f'**/*{ext}') if p.is_file()]
+                files_to_process = sorted(iter_files(target_path, self.cfg.ext_tuple), key=str)
             
             total_files = len(files_to_process)
             if self.progress_callback: self.progress_callback(0, total_files)
@@ -520,7 +829,7 @@ class MediaSorter:
                 processed_files += 1
                 logging.info(f"Analyzing: '{item.relative_to(target_path)}'")
                 
-                info = self.classifier.classify_media(item.stem, self.cfg.CUSTOM_STRINGS_TO_REMOVE)
+                info = self.classifier.classify_media(item.stem, self.cfg.custom_strings_set)
                 if info.media_type == MediaType.UNKNOWN:
                     logging.warning(f"SKIPPED: Could not identify '{item.name}', cannot generate clean name."); continue
                 
@@ -532,7 +841,7 @@ class MediaSorter:
                     elif s: new_stem = f"{info.title} - S{s:02d}"
                     else: logging.warning(f"SKIPPED: Could not extract season/episode from '{item.name}'."); continue
                 
-                sanitized_stem = re.sub(r'[<>:"/\\|?*]', '', new_stem).strip()
+                sanitized_stem = new_stem.translate(_FORBIDDEN_FS_CHARS).strip()
                 if not sanitized_stem: logging.error(f"Failed to generate valid name for '{item.name}'."); continue
                 
                 file_group = [item] + self.fm._find_sidecar_files(item)
@@ -544,7 +853,7 @@ class MediaSorter:
                     log_prefix = "DRY RUN:" if self.dry_run else "Renamed"
                     logging.info(f"{log_prefix}: '{file_to_rename.name}' -> '{new_name}'")
                     if not self.dry_run:
-                        try: shutil.move(str(file_to_rename), str(new_target_path))
+                        try: shutil.move(os.fspath(file_to_rename), os.fspath(new_target_path))
                         except Exception as ex: logging.error(f"ERROR renaming '{file_to_rename.name}': {ex}")
 
                 if self.progress_callback: self.progress_callback(processed_files, total_files)
@@ -557,41 +866,64 @@ class MediaSorter:
     def process_source_directory(self):
         self.is_processing = True
         try:
-            self.stop_event.clear(); self.stats = {k: 0 for k in ['processed','movies','tv','anime_movies','anime_series','split_lang_movies','unknown','errors']}
+            self.stop_event.clear(); self.fm.reset_run_state(); self._classify_cache.clear(); self._classify_locks.clear(); self.stats = {k: 0 for k in ['processed','movies','tv','anime_movies','anime_series','split_lang_movies','unknown','errors']}
             source_dir = self.cfg.get_path('SOURCE_DIR')
             if not source_dir or not source_dir.exists() or not self.ensure_target_dirs(): logging.error("Source/Target dir validation failed."); return
+            self._dests = self._destinations()
             logging.info("Starting deep scan of source directory...")
-            all_files = [p for ext in self.cfg.SUPPORTED_EXTENSIONS.union(self.cfg.SIDECAR_EXTENSIONS) for p in source_dir.glob(f'**/*{ext}') if p.is_file()]
-            mpath = self._get_mismatched_path()
-            if mpath and mpath.exists():
-                mpath_abs = mpath.resolve()
-                all_files = [f for f in all_files if not str(f.resolve().parent).startswith(str(mpath_abs))]
-            media_files = [f for f in all_files if f.suffix.lower() in self.cfg.SUPPORTED_EXTENSIONS]
-            total = len(media_files)
+            supported_exts, sidecar_exts = self.cfg.supported_ext_set, self.cfg.sidecar_ext_set
+            # The walk is consumed as a stream straight into the media list and the sidecar index, so no full listing of the tree is ever held;
+            # the mismatched folder is pruned during the walk instead of resolving every found file afterwards.
+            media_items, self._sidecar_index = [], {}
+            for f, sfx in iter_files_by_suffix(source_dir, supported_exts | sidecar_exts, prune=self._get_mismatched_path()):
+                if sfx in supported_exts: media_items.append((f, sfx))
+                if sfx in sidecar_exts: self._sidecar_index.setdefault((f.parent, f.stem), []).append(f)
+            total = len(media_items)
             if self.progress_callback: self.progress_callback(0, total)
-            if not media_files: logging.info("No primary media files found to process.")
+            if not media_items: logging.info("No primary media files found to process.")
             else:
                 logging.info(f"Found {total} primary media files to process.")
-                for i, fp in enumerate(media_files):
-                    if self.stop_event.is_set(): logging.warning("Sort run aborted."); break
-                    self.stats['processed'] += 1
-                    try: self.sort_item(fp)
-                    except Exception as e: self.stats['errors'] += 1; logging.error(f"Fatal error processing '{fp.name}': {e}", exc_info=True)
-                    if self.progress_callback: self.progress_callback(i + 1, total)
+                prefetch = None
+                if self.cfg.ANIME_MOVIES_ENABLED or self.cfg.ANIME_SERIES_ENABLED:
+                    cs, names = self.cfg.custom_strings_set, (f.parent.name if f.parent != source_dir else f.stem for f, _ in media_items)
+                    # Only names classify_media sends to AniList first ([Group] tag or CJK) are batched; the rest reach AniList per title,
+                    # and only when the main provider's match could be animation. The batches run alongside the main lookups below (different hosts).
+                    prefetch = self.api_client.prefetch_anilist([TitleCleaner.clean_for_search(n, cs) for n in names if (sg := TitleCleaner.extract_signals(n))['fansub'] or sg['cjk']], wait=False, stop=self.stop_event)
+                # Lookups wait on HTTP, so they overlap on a small pool (APIClient keeps per-endpoint pacing);
+                # moves are applied here, one at a time, as each classification completes.
+                def _work(fp: Path, sfx: str) -> Optional[MediaInfo]:
+                    if self.stop_event.is_set() or sfx in sidecar_exts: return None
+                    return self._identify_item(fp, source_dir=source_dir)
+                with ThreadPoolExecutor(max_workers=SORT_WORKERS, thread_name_prefix="smd-sort") as pool:
+                    futures = {pool.submit(_work, fp, sfx): fp for fp, sfx in media_items}
+                    for i, fut in enumerate(as_completed(futures), 1):
+                        if self.stop_event.is_set():
+                            for f in futures: f.cancel()
+                            break
+                        fp = futures[fut]; self._bump('processed')
+                        try:
+                            if info := fut.result(): self._place_item(fp, info)
+                        except Exception as e: self._bump('errors'); logging.error(f"Fatal error processing '{fp.name}': {e}", exc_info=True)
+                        if self.progress_callback: self.progress_callback(i, total)
+                if prefetch and not self.stop_event.is_set(): prefetch.join() # usually finished already; lets the last batches reach the cache before the summary
+                if self.stop_event.is_set(): logging.warning("Sort run aborted.")
             if not self.stop_event.is_set() and not self.cfg.CLEANUP_MODE_ENABLED: self.cleanup_empty_dirs(source_dir)
             self.log_summary()
-        finally: self.is_processing = False
+        finally: self._sidecar_index = self._dests = None; self.is_processing = False
     
     def cleanup_empty_dirs(self, path: Path):
         if self.dry_run: logging.info("DRY RUN: Skipping cleanup of empty directories."); return
         logging.info("Sweeping for empty directories...")
         mpath = self._get_mismatched_path()
-        for dirpath, _, _ in os.walk(path, topdown=False):
-            dp = Path(dirpath).resolve()
-            if dp == path.resolve() or (mpath and dp == mpath.resolve()): continue
-            try:
-                if not os.listdir(dirpath): os.rmdir(dirpath); logging.info(f"Removed empty directory: {dirpath}")
-            except OSError as e: logging.error(f"Error removing directory {dirpath}: {e}")
+        # Only folders this run moved files out of (and their parents) can have become empty; rmdir itself refuses non-empty ones.
+        skip, cands = {path, mpath}, set()
+        for d in self.fm.vacated_dirs:
+            while d not in cands and d not in skip and path in d.parents: cands.add(d); d = d.parent
+        for d in sorted(cands, key=lambda p: len(p.parts), reverse=True):
+            try: os.rmdir(d); logging.info(f"Removed empty directory: {d}")
+            except FileNotFoundError: pass
+            except OSError as e:
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST): logging.error(f"Error removing directory {d}: {e}")
 
     def start_watch_mode(self):
         self.stop_event.clear()
@@ -600,6 +932,17 @@ class MediaSorter:
         if self.stop_event.is_set():
             logging.info("Watch mode stopped during initial sort."); return
         watcher = DirectoryWatcher(self.cfg)
+        if watcher.start(ignore=self._get_mismatched_path()):
+            logging.info("Initial sort complete. Now watching the source directory for new files.")
+            try:
+                while watcher.wait_for_changes(self.stop_event):
+                    # wait_for_changes cleared the flag before returning, so a file arriving during this run leaves it set and triggers the next pass.
+                    logging.info("Changes detected! Starting new sort...")
+                    self.process_source_directory()
+                    if self.stop_event.is_set(): logging.warning("Watch loop interrupted."); break
+                    logging.info("Processing complete. Resuming watch.")
+            finally: watcher.stop()
+            logging.info("Watch mode stopped."); return
         interval = self.cfg.WATCH_INTERVAL
         logging.info(f"Initial sort complete. Now watching for changes every {interval // 60} minutes.")
         while not self.stop_event.is_set():
@@ -611,9 +954,7 @@ class MediaSorter:
                 logging.info("Processing complete. Resuming watch.")
             else:
                 logging.info("No new files found. Continuing to watch.")
-            for _ in range(interval):
-                if self.stop_event.is_set(): break
-                sleep(1)
+            self.stop_event.wait(interval) # wakes immediately on signal_stop instead of ticking once a second
         logging.info("Watch mode stopped.")
 
     def log_summary(self):
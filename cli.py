@@ -222,6 +222,8 @@ def main():
     except Exception as e:
         logging.error(f"A fatal error occurred: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        sorter.close()
 
 if __name__ == "__main__":
     main()
@@ -68,6 +68,7 @@ v6.0.1
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import logging
+import logging.handlers
 import threading
 from pathlib import Path
 from PIL import Image, ImageDraw
@@ -77,12 +78,26 @@ import tkinter
 import os
 import datetime
 import webbrowser
-from typing import List
+from typing import List, Set, Tuple
 import math
+import collections
+import functools
+import heapq
+import itertools
+import queue
+from concurrent.futures import ThreadPoolExecutor
+import re
 
 import bangbang as backend
 
 APP_NAME = "SortMeDown"
+LOG_DRAIN_INTERVAL_MS = 100; LOG_DRAIN_MAX_RECORDS = 500; LOG_MAX_LINES = 5000; LOG_TRIM_SLACK = 500; LOG_REPEAT_WINDOW = 0.05
+# Log colouring: one regex pass finds the first needle in the message (the marker always leads it); otherwise the level decides.
+_NEEDLE_TAGS = (("🔵⚪🔴", "FRENCH"), ("DRY RUN:", "DRYRUN"), ("Dry Run is ENABLED", "DRYRUN"), ("✅", "SUCCESS"), ("Settings saved", "SUCCESS"))
+_NEEDLE_RE = re.compile("|".join(f"({re.escape(n)})" for n, _ in _NEEDLE_TAGS)); _NEEDLE_GROUP_TAGS = (None,) + tuple(t for _, t in _NEEDLE_TAGS)
+_LEVEL_TAGS = {"WARNING": "WARNING", "ERROR": "ERROR", "CRITICAL": "ERROR"}
+TRAY_REFRESH_MS = 250
+MISMATCH_SCAN_BATCH = 50; MISMATCH_DRAIN_INTERVAL_MS = 30; MISMATCH_MERGE_THRESHOLD = 500
 
 def get_config_path() -> Path:
     # Portable mode check: Look for config next to the executable first.
@@ -116,18 +131,18 @@ def get_config_path() -> Path:
 
 CONFIG_FILE = get_config_path()
 
+_VERSION_LINE_RE = re.compile(r'^v\d[\d.]*')
+
 def get_version_info():
     """Parses the module's docstring to get version and history."""
     doc = __doc__ or ""
     lines = doc.strip().split('\n')
-    version = "v?.?.?"; history_content = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith('v'): version = stripped.split()[0]; break
-    changelog_started = False
+    version = None; history_content = []
     for line in lines:
-        if line.strip().startswith('v'): changelog_started = True
-        if changelog_started: history_content.append(line)
+        if _VERSION_LINE_RE.match(line.strip()):
+            if version is None: version = line.strip().split()[0]
+        if version is not None: history_content.append(line)
+    version = version or "v?.?.?"
     history = "\n".join(history_content) if history_content else "Version history not found."
     return version, history
 
@@ -136,28 +151,63 @@ def resource_path(relative_path):
     except Exception: base_path = Path(__file__).parent.absolute()
     return base_path / relative_path
 
+@functools.lru_cache(maxsize=1)
+def _build_tray_image(icon_path: str):
+    try: return Image.open(icon_path)
+    except: img = Image.new('RGB', (64, 64), "#1F6AA5"); dc = ImageDraw.Draw(img); dc.rectangle(((32, 0), (64, 32)), fill="#144870"); dc.rectangle(((0, 32), (32, 64)), fill="#144870"); return img
+
+_LOG_NAV_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End", "Shift_L", "Shift_R", "Control_L", "Control_R"))
+def _log_readonly_key(e):
+    # Ctrl+C / Ctrl+A and navigation pass through to the Text bindings; every other key would edit the log.
+    if e.keysym in _LOG_NAV_KEYS or (e.state & 0x4 and e.keysym.lower() in ("c", "a", "slash", "home", "end")): return None
+    return "break"
+
+class _SecondFormatter(logging.Formatter):
+    """Reuses the timestamp string for all records logged within the same second (the format has no sub-second field)."""
+    _last_sec, _last_time = None, ""
+    def formatTime(self, record, datefmt=None):
+        if (sec := int(record.created)) != self._last_sec: self._last_sec, self._last_time = sec, super().formatTime(record, datefmt)
+        return self._last_time
+
+class _RepeatFilter(logging.Filter):
+    """Drops an INFO line identical to the one just before it within LOG_REPEAT_WINDOW seconds; warnings and errors always pass."""
+    _last_key, _last_time = None, 0.0
+    def filter(self, record):
+        if record.levelno >= logging.WARNING: return True
+        key, t = (record.module, record.msg), record.created
+        if key == self._last_key and t - self._last_time < LOG_REPEAT_WINDOW: return False
+        self._last_key, self._last_time = key, t; return True
+
+# Built once at import: a re-created App reuses them instead of rebuilding, and the timestamp cache stays warm.
+_LOG_FORMATTER = _SecondFormatter("%(asctime)s - %(message)s", "%H:%M:%S"); _QUEUE_FORMATTER = logging.Formatter("%(message)s")
+
 class GuiLoggingHandler(logging.Handler):
-    def __init__(self, text_widget):
+    def __init__(self, text_widget, max_buffered: int = 10000):
         super().__init__(); self.text_widget = text_widget
+        # Fixed-capacity ring buffer: the backend never waits on Tk, and the oldest lines are dropped if the GUI falls behind.
+        self._log_buf = collections.deque(maxlen=max_buffered); self._log_lock = threading.Lock(); self._dropped = 0
         self.text_widget.tag_config("INFO", foreground="white"); self.text_widget.tag_config("DRYRUN", foreground="#00FFFF")
         self.text_widget.tag_config("WARNING", foreground="orange"); self.text_widget.tag_config("ERROR", foreground="#FF5555")
         self.text_widget.tag_config("SUCCESS", foreground="#00FF7F"); self.text_widget.tag_config("FRENCH", foreground="#6495ED")
     def emit(self, record):
-        msg = self.format(record); tag = "INFO"
-        if "🔵⚪🔴" in msg: tag = "FRENCH"
-        elif "DRY RUN:" in msg or "Dry Run is ENABLED" in msg: tag = "DRYRUN"
-        elif "✅" in msg or "Settings saved" in msg: tag = "SUCCESS"
-        elif record.levelname == "WARNING": tag = "WARNING"
-        elif record.levelname in ["ERROR", "CRITICAL"]: tag = "ERROR"
-        def insert_text():
-            if self.text_widget.winfo_exists():
-                self.text_widget.configure(state="normal")
-                self.text_widget.insert(ctk.END, msg + '\n', tag)
-                self.text_widget.see(ctk.END)
-                self.text_widget.configure(state="disabled")
-        if hasattr(self.text_widget, 'after'):
-            try: self.text_widget.after(0, insert_text)
-            except Exception: pass
+        msg = self.format(record) # also sets record.message: needles are matched against it, not the timestamped line
+        # Call sites that know their colour pass extra={"tag": ...}; only the rest are scanned.
+        if not (tag := getattr(record, "tag", None)): tag = _NEEDLE_GROUP_TAGS[m.lastindex] if (m := _NEEDLE_RE.search(record.message)) else _LEVEL_TAGS.get(record.levelname, "INFO")
+        with self._log_lock:
+            if len(self._log_buf) == self._log_buf.maxlen: self._dropped += 1
+            self._log_buf.append((msg, tag))
+    def drain(self, limit: int = LOG_DRAIN_MAX_RECORDS) -> List[Tuple[str, str]]:
+        with self._log_lock:
+            pop = self._log_buf.popleft; batch = [pop() for _ in range(min(limit, len(self._log_buf)))]
+            # Say so when the ring buffer overflowed, so a gap in the log is not mistaken for inactivity.
+            if self._dropped: batch.insert(0, (f"... {self._dropped} earlier log line(s) dropped while the log view was behind ...", "WARNING")); self._dropped = 0
+        return batch
+
+def _unless_quitting(fn):
+    """Turns an App entry point into a no-op once quit_app has started (tray clicks and queued callbacks can still arrive)."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs): return None if self.is_quitting else fn(self, *args, **kwargs)
+    return wrapper
 
 class App(ctk.CTk):
     def __init__(self):
@@ -167,14 +217,20 @@ class App(ctk.CTk):
         self.title(f"SortMeDown Media Sorter {self.version}"); self.geometry("900x900"); ctk.set_appearance_mode("Dark")
         self.after(200, self._set_window_icon)
         
-        self.config = backend.Config.load(CONFIG_FILE)
-        self.sorter_thread = None; self.sorter_instance = None; self.tray_icon = None; self.tray_thread = None; self.tab_view = None
-        self.is_quitting = False; self.path_entries = {}; self.mismatch_buttons = {}; self.default_button_color = None; self.default_hover_color = None
-        self.is_watching = False; self.log_is_visible = True; self.selected_mismatched_file = None
+        self.config = backend.Config.load(CONFIG_FILE); self._saved_config = self._config_snapshot() if CONFIG_FILE.is_file() else None # first run still writes the file
+        self.sorter_thread = None; self.sorter_instance = None; self.tray_icon = None; self.tray_thread = None; self.tab_view = None; self._tray_image = None
+        self._task_events = queue.Queue(); self._task_drain_scheduled = False; self._tray_refresh_scheduled = False; self._last_browse_dir = None; self._btn_state = {}
+        self.is_quitting = False; self._ui_alive = True; self._log_lines = 0; self.path_entries = {}; self.path_vars = {}; self._dirty_keys = set(); self.mismatch_buttons = {}; self.default_button_color = None; self.default_hover_color = None
+        self._last_split_langs_raw = self._last_sidecar_raw = self._last_custom_strings_raw = None
+        self.is_watching = False; self.log_is_visible = True; self.selected_mismatched_file = None; self._mismatch_sel_seq = 0
+        self._mismatch_queue = queue.Queue(); self._mismatch_scan_seq = 0; self._mismatch_sorted: List[Tuple[str, str, Path]] = [] # (name, path string, Path), sorted by name
+        self._mismatch_pending: List[Tuple[str, str, Path]] = []; self._mismatch_last_added = None; self._mismatch_order_dirty = False; self._last_selected_mismatch_btn = None
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="smd-ui") # One-off UI actions; long sorter runs keep their own thread
         
         # --- START: Variables for Reorganize Tab Pagination ---
-        self.reorganize_all_files = []
+        self.reorganize_all_files: List[Tuple[Path, str]] = [] # (path, label relative to the scanned folder)
         self.reorganize_selection_state = {}
+        self.reorganize_selected_count = 0 # Kept in step with reorganize_selection_state so the status label never recounts it
         self.reorganize_current_page = 0
         self.reorganize_items_per_page = 200 # Manageable number of widgets
         # --- END: Reorganize Tab Pagination Variables ---
@@ -192,14 +248,19 @@ class App(ctk.CTk):
         self.grid_columnconfigure(0, weight=1); self.grid_rowconfigure(0, weight=0); self.grid_rowconfigure(1, weight=1); self.grid_rowconfigure(2, weight=0)
         self.controls_frame = ctk.CTkFrame(self); self.controls_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.create_controls()
-        self.log_textbox = ctk.CTkTextbox(self, state="disabled", font=("Courier New", 12)); self.log_textbox.grid(row=1, column=0, padx=10, pady=(0,5), sticky="nsew")
+        self.log_textbox = ctk.CTkTextbox(self, font=("Courier New", 12)); self.log_textbox.grid(row=1, column=0, padx=10, pady=(0,5), sticky="nsew")
+        # Stays in state "normal" so the log drain never toggles it; edits are swallowed here while selection, copy and scrolling keep working.
+        self.log_textbox.bind("<Key>", _log_readonly_key)
+        for ev in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"): self.log_textbox.bind(ev, lambda e: "break")
+        self.log_textbox.bind("<Destroy>", lambda e: setattr(self, "_ui_alive", False)) # covers any teardown path that bypasses _perform_safe_shutdown
         self.progress_frame = ctk.CTkFrame(self, fg_color="transparent"); self.progress_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10)); self.progress_frame.grid_columnconfigure(0, weight=1)
         self.progress_label = ctk.CTkLabel(self.progress_frame, text=""); self.progress_label.grid(row=0, column=0, sticky="w", padx=5)
         self.progress_bar = ctk.CTkProgressBar(self.progress_frame); self.progress_bar.set(0); self.progress_bar.grid(row=1, column=0, sticky="ew", padx=5)
         self.version_label = ctk.CTkLabel(self.progress_frame, text=self.version, text_color="gray50"); self.version_label.grid(row=0, column=1, rowspan=2, padx=(10, 5), sticky="e")
         self.progress_frame.grid_remove()
 
-        self.setup_logging(); self.protocol("WM_DELETE_WINDOW", self.quit_app); self.bind("<Unmap>", self.on_minimize); self.setup_tray_icon(); self.update_fallback_ui_state()
+        self.setup_logging(); self.protocol("WM_DELETE_WINDOW", self.quit_app); self.bind("<Unmap>", self.on_minimize); self.update_fallback_ui_state()
+        self.after_idle(self.setup_tray_icon) # the window paints first; starting the tray can block briefly in shell APIs
         self.after(500, self.check_api_keys_on_startup)
 
     def check_api_keys_on_startup(self):
@@ -213,19 +274,54 @@ class App(ctk.CTk):
         except Exception as e: logging.warning(f"Could not set window icon: {e}")
 
     def setup_logging(self):
-        log_handler = GuiLoggingHandler(self.log_textbox)
-        log_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s", "%H:%M:%S"))
-        logging.basicConfig(level=logging.INFO, handlers=[log_handler], force=True)
+        self.log_handler = GuiLoggingHandler(self.log_textbox)
+        self.log_handler.setFormatter(_LOG_FORMATTER); self.log_handler.setLevel(logging.INFO)
+        self.log_handler.addFilter(_RepeatFilter()) # runs before format(), so dropped repeats cost nothing further
+        # Nothing in the log line uses thread/process fields, so skip collecting them for every LogRecord.
+        logging.logThreads = logging.logProcesses = logging.logMultiprocessing = False
+        # Logging threads only enqueue; formatting and tag classification happen on the listener's thread.
+        log_q = queue.SimpleQueue(); qh = logging.handlers.QueueHandler(log_q); qh.setFormatter(_QUEUE_FORMATTER) # without one, QueueHandler.prepare would bake in a level:name prefix
+        # The queue handler must be the root's only one: the logging.info calls in get_config_path ran at import with no handler set,
+        # which made logging attach a stderr StreamHandler that would otherwise format every record synchronously on the logging thread.
+        root = logging.getLogger(); root.setLevel(logging.INFO)
+        for h in root.handlers[:]: root.removeHandler(h); h.close()
+        root.addHandler(qh)
+        self._log_listener = logging.handlers.QueueListener(log_q, self.log_handler, respect_handler_level=True); self._log_listener.start()
+        self.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+
+    def _log_panel_shown(self) -> bool: return self.log_is_visible and self.tab_view.get() != "About"
+
+    def _drain_log(self):
+        # While the log panel is hidden, records stay in the handler's ring buffer and are rendered in one go once it is shown again.
+        if not self._ui_alive: return
+        if self._log_panel_shown(): self._flush_log()
+        self.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+
+    def _flush_log(self):
+        # A plain flag instead of winfo_exists(): no Tcl round-trip per tick, and it is cleared before destroy() so no flush can race it.
+        if not self._ui_alive: return
+        if batch := self.log_handler.drain():
+            # One insert per run of same-tag lines keeps line order while cutting Tk calls from one per record to a handful per tick.
+            for tag, run in itertools.groupby(batch, key=lambda r: r[1]): self.log_textbox.insert(ctk.END, ''.join(m + '\n' for m, _ in run), tag)
+            # Cap the widget so long watch sessions don't make every insert pay for an ever-growing text index.
+            # Lines are counted here, so Tk is only asked (and trimmed back to the cap) once LOG_TRIM_SLACK lines have piled up past it.
+            self._log_lines += sum(m.count('\n') + 1 for m, _ in batch)
+            if self._log_lines > LOG_MAX_LINES + LOG_TRIM_SLACK:
+                if (n := int(self.log_textbox.index('end-1c').split('.')[0])) > LOG_MAX_LINES: self.log_textbox.delete('1.0', f'{n - LOG_MAX_LINES}.0')
+                self._log_lines = min(n, LOG_MAX_LINES)
+            self.log_textbox.see(ctk.END)
         
     def create_controls(self):
         self.tab_view = ctk.CTkTabview(self.controls_frame); self.tab_view.pack(expand=True, fill="both", padx=5, pady=5)
-        self.create_actions_tab(self.tab_view.add("Actions")); self.create_settings_tab(self.tab_view.add("Settings"))
+        # Settings is only populated when first shown; most sessions never open it.
+        self.create_actions_tab(self.tab_view.add("Actions")); self._settings_tab = self.tab_view.add("Settings"); self._settings_built = False
         self.create_reorganize_tab(self.tab_view.add("Reorganize")); self.create_mismatch_tab(self.tab_view.add("Review"))
         self.create_about_tab(self.tab_view.add("About")); self.tab_view.configure(command=self.on_tab_selected); self.tab_view.set("Actions")
 
     def on_tab_selected(self):
         tab_name = self.tab_view.get()
         if tab_name == "Review": self.scan_mismatched_files()
+        elif tab_name == "Settings": self._ensure_settings_tab()
         
         # This logic now correctly applies to all tabs
         if tab_name == "About":
@@ -234,7 +330,7 @@ class App(ctk.CTk):
         else:
             self.grid_rowconfigure(0, weight=0); self.grid_rowconfigure(1, weight=1)
             if self.log_is_visible:
-                self.log_textbox.grid()
+                self.log_textbox.grid(); self._flush_log()
             else:
                 self.log_textbox.grid_remove()
 
@@ -248,7 +344,7 @@ class App(ctk.CTk):
         of = ctk.CTkFrame(parent, fg_color="transparent"); of.grid(row=2, column=0, columnspan=3, sticky="ew"); of.grid_columnconfigure((0,1), weight=1)
         self.dry_run_checkbox = ctk.CTkCheckBox(of, text="Dry Run", variable=self.dry_run_var); self.dry_run_checkbox.grid(row=0, column=0, padx=5, pady=5, sticky="w")
         wif = ctk.CTkFrame(of, fg_color="transparent"); wif.grid(row=0, column=1, padx=5, pady=5, sticky="e")
-        ctk.CTkLabel(wif, text="Check every").pack(side="left", padx=(0,5)); self.watch_interval_entry = ctk.CTkEntry(wif, width=40); self.watch_interval_entry.pack(side="left"); self.watch_interval_entry.insert(0, str(self.config.WATCH_INTERVAL // 60)); ctk.CTkLabel(wif, text="minutes").pack(side="left", padx=(5,0))
+        ctk.CTkLabel(wif, text="Check every").pack(side="left", padx=(0,5)); self.watch_interval_var = self._tracked_var('WATCH_INTERVAL', str(self.config.WATCH_INTERVAL // 60)); self.watch_interval_entry = ctk.CTkEntry(wif, width=40, textvariable=self.watch_interval_var); self.watch_interval_entry.pack(side="left"); ctk.CTkLabel(wif, text="minutes").pack(side="left", padx=(5,0))
         self.toggle_log_button = ctk.CTkButton(of, text="Hide Log", width=100, command=self.toggle_log_visibility); self.toggle_log_button.grid(row=1, column=1, sticky="e", padx=5, pady=5)
         ctk.CTkFrame(parent, height=2, fg_color="gray25").grid(row=3, column=0, pady=(10, 5), sticky="ew")
         tf = ctk.CTkFrame(parent, fg_color="transparent"); tf.grid(row=4, column=0, sticky="ew", pady=(0, 5)); tf.grid_columnconfigure((0, 1, 2, 3), weight=1)
@@ -274,7 +370,13 @@ class App(ctk.CTk):
         ctk.CTkButton(top_frame, text="Scan for Files", width=100, command=self.scan_reorganize_folder).grid(row=0, column=3, padx=(5, 10), pady=10)
 
         # --- File List Frame ---
-        self.reorganize_files_frame = ctk.CTkScrollableFrame(parent, label_text="Files Found in Target Library"); self.reorganize_files_frame.grid(row=2, column=0, padx=10, pady=(0,5), sticky="nsew")
+        # A single Listbox only draws the visible rows, so a page turn rewrites text instead of building hundreds of checkbox widgets.
+        list_frame = ctk.CTkFrame(parent); list_frame.grid(row=2, column=0, padx=10, pady=(0,5), sticky="nsew"); list_frame.grid_columnconfigure(0, weight=1); list_frame.grid_rowconfigure(1, weight=1)
+        ctk.CTkLabel(list_frame, text="Files Found in Target Library").grid(row=0, column=0, columnspan=2, pady=(5,0))
+        self.reorganize_listbox = tkinter.Listbox(list_frame, activestyle="none", exportselection=False, borderwidth=0, highlightthickness=0, font=("Courier New", 11),
+                                                  bg="#2B2B2B", fg="#DCE4EE", selectbackground="#2B2B2B", selectforeground="#DCE4EE")
+        self.reorganize_listbox.grid(row=1, column=0, padx=(5,0), pady=5, sticky="nsew"); self.reorganize_listbox.bind("<ButtonRelease-1>", self.reorganize_on_row_click)
+        sb = ctk.CTkScrollbar(list_frame, command=self.reorganize_listbox.yview); sb.grid(row=1, column=1, pady=5, sticky="ns"); self.reorganize_listbox.configure(yscrollcommand=sb.set)
 
         # --- Middle Controls (Pagination & Selection) ---
         check_frame = ctk.CTkFrame(parent, fg_color="transparent"); check_frame.grid(row=1, column=0, padx=10, pady=0, sticky="ew"); check_frame.grid_columnconfigure(1, weight=1)
@@ -301,7 +403,7 @@ class App(ctk.CTk):
         ap = ctk.CTkFrame(mf); ap.grid(row=0, column=1, sticky="nsew", padx=(5,0)); ap.grid_columnconfigure(0, weight=1)
         self.mismatch_selected_label = ctk.CTkLabel(ap, text="No file selected.", wraplength=350, justify="left"); self.mismatch_selected_label.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         ctk.CTkLabel(ap, text="Enter correct name: Title (Year)").grid(row=1, column=0, sticky="w", padx=10)
-        self.mismatch_name_entry = ctk.CTkEntry(ap); self.mismatch_name_entry.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10))
+        self._mismatch_name_var = ctk.StringVar(); self.mismatch_name_entry = ctk.CTkEntry(ap, textvariable=self._mismatch_name_var); self.mismatch_name_entry.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 10))
         abf = ctk.CTkFrame(ap, fg_color="transparent"); abf.grid(row=3, column=0, sticky="ew", pady=10); abf.grid_columnconfigure((0,1), weight=1)
         self.mismatch_reprocess_button = ctk.CTkButton(abf, text="Re-process (API)", command=self.reprocess_selected_file); self.mismatch_reprocess_button.grid(row=0, column=0, padx=(10,5), sticky="ew")
         self.mismatch_delete_button = ctk.CTkButton(abf, text="Delete File", fg_color="#D32F2F", hover_color="#B71C1C", command=self.delete_selected_file); self.mismatch_delete_button.grid(row=0, column=1, padx=(5,10), sticky="ew")
@@ -315,24 +417,31 @@ class App(ctk.CTk):
         self.force_anime_series_btn.grid(row=1, column=0, padx=2, pady=2, sticky="ew"); self.force_anime_movie_btn.grid(row=1, column=1, padx=2, pady=2, sticky="ew")
         self.force_split_lang_movie_btn.grid(row=2, column=0, padx=2, pady=2, sticky="ew"); self._update_mismatch_panel_state()
         
+    def _ensure_settings_tab(self):
+        if not self._settings_built: self._settings_built = True; self.create_settings_tab(self._settings_tab)
+
     def create_settings_tab(self, parent):
-        parent.grid_columnconfigure(1, weight=1); self.path_entries = {}; row = 0
+        parent.grid_columnconfigure(1, weight=1); self.path_entries = {}; self.path_vars = {}; row = 0
         pm = {'SOURCE_DIR': 'Source Directory (for Actions tab)', 'MOVIES_DIR': 'Movies Directory', 'TV_SHOWS_DIR': 'TV Shows Directory', 'ANIME_MOVIES_DIR': 'Anime Movies Directory', 'ANIME_SERIES_DIR': 'Anime Series Directory', 'MISMATCHED_DIR': 'Mismatched Files Directory'}
-        for key, label in pm.items(): row = self._create_path_entry_row(parent, row, key, label)
-        ctk.CTkLabel(parent, text="Split Language Movies Dir").grid(row=row, column=0, padx=5, pady=5, sticky="w"); self.split_movies_dir_entry = ctk.CTkEntry(parent, width=400); self.split_movies_dir_entry.insert(0, getattr(self.config, "SPLIT_MOVIES_DIR", "")); self.path_entries["SPLIT_MOVIES_DIR"] = self.split_movies_dir_entry; ctk.CTkButton(parent, text="Browse...", width=80, command=lambda e=self.split_movies_dir_entry: self.browse_folder(e)).grid(row=row, column=2, padx=5, pady=5); self.split_movies_dir_entry.grid(row=row, column=1, padx=5, pady=5, sticky="ew"); row += 1
+        cfg = vars(self.config) # one plain dict for all the reads below
+        for key, label in pm.items(): row = self._create_path_entry_row(parent, row, key, label, cfg.get(key, ""))
+        ctk.CTkLabel(parent, text="Split Language Movies Dir").grid(row=row, column=0, padx=5, pady=5, sticky="w"); sv = self.path_vars["SPLIT_MOVIES_DIR"] = self._tracked_var("SPLIT_MOVIES_DIR", cfg.get("SPLIT_MOVIES_DIR", "")); self.split_movies_dir_entry = ctk.CTkEntry(parent, width=400, textvariable=sv); self.path_entries["SPLIT_MOVIES_DIR"] = self.split_movies_dir_entry; ctk.CTkButton(parent, text="Browse...", width=80, command=lambda: self.browse_folder(sv)).grid(row=row, column=2, padx=5, pady=5); self.split_movies_dir_entry.grid(row=row, column=1, padx=5, pady=5, sticky="ew"); row += 1
         ctk.CTkLabel(parent, text="Languages to Split").grid(row=row, column=0, padx=5, pady=5, sticky="w"); self.split_languages_entry = ctk.CTkEntry(parent, placeholder_text='e.g., fr, es, de, all'); self.split_languages_entry.grid(row=row, column=1, columnspan=2, padx=5, pady=5, sticky="ew");
-        if self.config.LANGUAGES_TO_SPLIT: self.split_languages_entry.insert(0, ", ".join(self.config.LANGUAGES_TO_SPLIT)); row += 1
+        if self.config.LANGUAGES_TO_SPLIT: self.split_languages_entry.insert(0, ", ".join(self.config.LANGUAGES_TO_SPLIT))
+        row += 1
         ctk.CTkLabel(parent, text="Sidecar Extensions").grid(row=row, column=0, padx=5, pady=5, sticky="w"); self.sidecar_entry = ctk.CTkEntry(parent, placeholder_text=".srt, .nfo, .txt"); self.sidecar_entry.grid(row=row, column=1, columnspan=2, padx=5, pady=5, sticky="ew");
-        if self.config.SIDECAR_EXTENSIONS: self.sidecar_entry.insert(0, ", ".join(self.config.SIDECAR_EXTENSIONS)); row += 1
+        if self.config.SIDECAR_EXTENSIONS: self.sidecar_entry.insert(0, ", ".join(self.config.SIDECAR_EXTENSIONS))
+        row += 1
         ctk.CTkLabel(parent, text="Custom Strings to Remove").grid(row=row, column=0, padx=5, pady=5, sticky="w"); self.custom_strings_entry = ctk.CTkEntry(parent, placeholder_text="FRENCH, VOSTFR"); self.custom_strings_entry.grid(row=row, column=1, columnspan=2, padx=5, pady=5, sticky="ew");
-        if self.config.CUSTOM_STRINGS_TO_REMOVE: self.custom_strings_entry.insert(0, ", ".join(self.config.CUSTOM_STRINGS_TO_REMOVE)); row += 1
+        if self.config.CUSTOM_STRINGS_TO_REMOVE: self.custom_strings_entry.insert(0, ", ".join(self.config.CUSTOM_STRINGS_TO_REMOVE))
+        row += 1
         ctk.CTkLabel(parent, text="Primary Provider").grid(row=row, column=0, padx=5, pady=5, sticky="w"); pf = ctk.CTkFrame(parent, fg_color="transparent"); pf.grid(row=row, column=1, columnspan=2, sticky="ew", padx=5, pady=5); ctk.CTkSegmentedButton(pf, values=["OMDb", "TMDB"], variable=self.api_provider_var).pack(side="left"); ctk.CTkLabel(pf, text="If both API keys are entered, the other will be used as a fallback.", text_color="gray50").pack(side="left", padx=(10,0)); row += 1
         ctk.CTkLabel(parent, text="OMDb API Key").grid(row=row, column=0, padx=5, pady=5, sticky="w"); oaf = ctk.CTkFrame(parent, fg_color="transparent"); oaf.grid(row=row, column=1, columnspan=2, sticky="ew"); oaf.grid_columnconfigure(0, weight=1); self.omdb_api_key_entry = ctk.CTkEntry(oaf, placeholder_text="Enter OMDb API key"); self.omdb_api_key_entry.grid(row=0, column=0, sticky="ew");
         if self.config.OMDB_API_KEY and self.config.OMDB_API_KEY != "yourkey": self.omdb_api_key_entry.insert(0, self.config.OMDB_API_KEY); self.omdb_api_key_entry.configure(show="*");
-        self.omdb_api_key_entry.bind("<Key>", lambda e: self.omdb_api_key_entry.configure(show="*")); ctk.CTkButton(oaf, text="Test Key", width=80, command=lambda: self.test_api_key_clicked("omdb")).grid(row=0, column=1, padx=(10,0)); row += 1
+        self._mask_on_first_key(self.omdb_api_key_entry); ctk.CTkButton(oaf, text="Test Key", width=80, command=lambda: self.test_api_key_clicked("omdb")).grid(row=0, column=1, padx=(10,0)); row += 1
         ctk.CTkLabel(parent, text="TMDB API Key").grid(row=row, column=0, padx=5, pady=5, sticky="w"); taf = ctk.CTkFrame(parent, fg_color="transparent"); taf.grid(row=row, column=1, columnspan=2, sticky="ew"); taf.grid_columnconfigure(0, weight=1); self.tmdb_api_key_entry = ctk.CTkEntry(taf, placeholder_text="Enter TMDB API key"); self.tmdb_api_key_entry.grid(row=0, column=0, sticky="ew");
         if self.config.TMDB_API_KEY and self.config.TMDB_API_KEY != "yourkey": self.tmdb_api_key_entry.insert(0, self.config.TMDB_API_KEY); self.tmdb_api_key_entry.configure(show="*");
-        self.tmdb_api_key_entry.bind("<Key>", lambda e: self.tmdb_api_key_entry.configure(show="*")); ctk.CTkButton(taf, text="Test Key", width=80, command=lambda: self.test_api_key_clicked("tmdb")).grid(row=0, column=1, padx=(10,0)); row += 1
+        self._mask_on_first_key(self.tmdb_api_key_entry); ctk.CTkButton(taf, text="Test Key", width=80, command=lambda: self.test_api_key_clicked("tmdb")).grid(row=0, column=1, padx=(10,0)); row += 1
         ctk.CTkButton(parent, text="Save Settings", command=self.save_settings).grid(row=row, column=1, columnspan=2, padx=5, pady=10, sticky="e")
 
     def create_about_tab(self, parent):
@@ -350,121 +459,228 @@ class App(ctk.CTk):
         btb = ctk.CTkTextbox(hf, wrap="word", font=("Courier New", 12)); btb.grid(row=1, column=0, padx=10, pady=(2, 10), sticky="nsew"); btb.insert("1.0", self.version_history); btb.configure(state="disabled", height=200)
 
     def _set_options_state(self, state: str):
-        self.dry_run_checkbox.configure(state=state); self.watch_interval_entry.configure(state=state)
-        for cb in self.toggles_map.values(): cb.configure(state=state)
-        for rb in [self.ignore_radio, self.mismatch_radio, self.tv_radio, self.anime_radio]: rb.configure(state=state)
+        for w in (self.dry_run_checkbox, self.watch_interval_entry, *self.toggles_map.values(), self.ignore_radio, self.mismatch_radio): self._set_btn(w, state=state)
+        # Re-enabling goes straight to the fallback rules, so the TV/Anime radios are not switched on only to be switched off again.
         if state == "normal": self.update_fallback_ui_state()
+        else: self._set_btn(self.tv_radio, state=state); self._set_btn(self.anime_radio, state=state)
 
     def _update_mismatch_panel_state(self):
         isfs = self.selected_mismatched_file is not None; s = "normal" if isfs else "disabled"
         self.mismatch_name_entry.configure(state=s); self.mismatch_reprocess_button.configure(state=s); self.mismatch_delete_button.configure(state=s)
         self.force_movie_btn.configure(state=s); self.force_tv_btn.configure(state=s); self.force_anime_series_btn.configure(state=s); self.force_anime_movie_btn.configure(state=s)
-        sdp = self.path_entries.get('SPLIT_MOVIES_DIR', ctk.CTkEntry(self)).get(); ss = s if sdp else "disabled"; self.force_split_lang_movie_btn.configure(state=ss)
-        if not isfs: self.mismatch_selected_label.configure(text="No file selected."); self.mismatch_name_entry.delete(0, ctk.END)
+        sdp = self.path_vars['SPLIT_MOVIES_DIR'].get() if 'SPLIT_MOVIES_DIR' in self.path_vars else self.config.SPLIT_MOVIES_DIR; ss = s if sdp else "disabled"; self.force_split_lang_movie_btn.configure(state=ss)
+        if not isfs: self.mismatch_selected_label.configure(text="No file selected."); self._mismatch_name_var.set("")
         else: self.mismatch_selected_label.configure(text=f"Selected: {self.selected_mismatched_file.name}")
 
     def scan_mismatched_files(self):
         for w in self.mismatched_files_frame.winfo_children(): w.destroy()
-        self.mismatch_buttons = {}; self.selected_mismatched_file = None; self._update_mismatch_panel_state()
+        self.mismatch_buttons = {}; self._mismatch_sorted = []; self._mismatch_pending = []; self._mismatch_last_added = None; self._mismatch_order_dirty = False
+        self.selected_mismatched_file = None; self._last_selected_mismatch_btn = None; self._update_mismatch_panel_state()
+        self._mismatch_scan_seq += 1
         md = self.config.get_path('MISMATCHED_DIR') or (self.config.get_path('SOURCE_DIR') / '_Mismatched' if self.config.get_path('SOURCE_DIR') else None)
         if not md or not md.exists(): ctk.CTkLabel(self.mismatched_files_frame, text="Mismatched directory not configured or found.").pack(); return
-        mfs = [p for ext in self.config.SUPPORTED_EXTENSIONS for p in md.glob(f'**/*{ext}') if p.is_file()]
-        if not mfs: ctk.CTkLabel(self.mismatched_files_frame, text="No media files found.").pack(); return
-        smfs = sorted(mfs, key=lambda p: p.name)
-        for fp in smfs: btn = ctk.CTkButton(self.mismatched_files_frame, text=fp.name, command=lambda f=fp: self.select_mismatched_file(f), fg_color="transparent", anchor="w"); btn.pack(fill="x", padx=2, pady=2); self.mismatch_buttons[fp] = btn
-        if smfs: self.after(50, lambda: self.select_mismatched_file(smfs[0]))
+        # The walk streams batches through a queue so the first files show up while a slow share is still being scanned.
+        self._submit(self._mismatch_scan_worker, md, self.config.ext_tuple, self._mismatch_scan_seq)
+        self.after(MISMATCH_DRAIN_INTERVAL_MS, self._drain_mismatch_queue, self._mismatch_scan_seq)
+
+    def _mismatch_scan_worker(self, md: Path, exts: Tuple[str, ...], seq: int):
+        batch = []
+        def _flush(): self._mismatch_queue.put((seq, sorted((os.path.basename(p), p) for p in batch)))
+        try:
+            for p in backend.iter_file_paths(md, exts):
+                if seq != self._mismatch_scan_seq: return
+                batch.append(p)
+                if len(batch) >= MISMATCH_SCAN_BATCH: _flush(); batch = []
+        finally: _flush(); self._mismatch_queue.put((seq, None))
+
+    def _drain_mismatch_queue(self, seq: int):
+        if seq != self._mismatch_scan_seq: return
+        done = False
+        while not done:
+            try: s, batch = self._mismatch_queue.get_nowait()
+            except queue.Empty: break
+            if s != seq: continue
+            if batch is None: done = True
+            else:
+                for name, path_str in batch: self._add_mismatch_button(name, path_str)
+                if len(self._mismatch_pending) >= MISMATCH_MERGE_THRESHOLD: self._merge_mismatch_pending()
+        if not done: self.after(MISMATCH_DRAIN_INTERVAL_MS, self._drain_mismatch_queue, seq); return
+        self._merge_mismatch_pending()
+        if self._mismatch_order_dirty:
+            # Buttons were appended in arrival order. pack() on an already-packed widget keeps its slot, so all are forgotten first and re-packed, unmapped, in sorted order.
+            self.mismatched_files_frame.grid_remove()
+            try:
+                for b in self.mismatch_buttons.values(): b.pack_forget()
+                for _, _, fp in self._mismatch_sorted: self.mismatch_buttons[fp].pack(fill="x", padx=2, pady=2)
+            finally: self.mismatched_files_frame.grid(); self._mismatch_order_dirty = False
+        if not self._mismatch_sorted: ctk.CTkLabel(self.mismatched_files_frame, text="No media files found.").pack()
+        elif not self.selected_mismatched_file: self.select_mismatched_file(self._mismatch_sorted[0][2])
+
+    def _merge_mismatch_pending(self):
+        # Each batch arrives pre-sorted, so a merge keeps the list ordered without per-insert shifting.
+        if self._mismatch_pending: self._mismatch_sorted = list(heapq.merge(self._mismatch_sorted, sorted(self._mismatch_pending))); self._mismatch_pending = []
+
+    def _add_mismatch_button(self, name: str, path_str: str):
+        # Sorting works on plain strings; a Path is only built for the button's key and the backend calls.
+        fp = Path(path_str); entry = (name, path_str, fp)
+        btn = ctk.CTkButton(self.mismatched_files_frame, text=name, command=lambda f=fp: self.select_mismatched_file(f), fg_color="transparent", anchor="w"); btn.pack(fill="x", padx=2, pady=2)
+        if self._mismatch_last_added and entry < self._mismatch_last_added: self._mismatch_order_dirty = True
+        self._mismatch_last_added = entry; self._mismatch_pending.append(entry); self.mismatch_buttons[fp] = btn
 
     def select_mismatched_file(self, file_path: Path):
         self.selected_mismatched_file = file_path
-        for p, b in self.mismatch_buttons.items(): b.configure(fg_color=self.default_button_color if p == file_path else "transparent")
-        self.update_config_from_ui(); fs = self.selected_mismatched_file.stem; ct = backend.TitleCleaner.clean_for_search(fs, self.config.CUSTOM_STRINGS_TO_REMOVE); y = backend.TitleCleaner.extract_year(fs)
-        sn = f"{ct} ({y})" if y else ct; self.mismatch_name_entry.delete(0, ctk.END); self.mismatch_name_entry.insert(0, sn); self._update_mismatch_panel_state()
+        # Only the previously highlighted button and the new one change colour.
+        if self._last_selected_mismatch_btn and self._last_selected_mismatch_btn.winfo_exists(): self._last_selected_mismatch_btn.configure(fg_color="transparent")
+        if btn := self.mismatch_buttons.get(file_path): btn.configure(fg_color=self.default_button_color)
+        self._last_selected_mismatch_btn = btn
+        self.update_config_from_ui(); self._update_mismatch_panel_state()
+        # Title cleaning runs on a worker; the sequence stamp drops results for a file that is no longer selected.
+        self._mismatch_sel_seq += 1
+        self._submit(self._compute_suggested_name, file_path, self.config.custom_strings_set, self._mismatch_sel_seq)
+
+    def _compute_suggested_name(self, file_path: Path, custom_strings: Set[str], seq: int):
+        fs = file_path.stem; ct = backend.TitleCleaner.clean_for_search(fs, custom_strings); y = backend.TitleCleaner.extract_year(fs)
+        self.after(0, self._apply_suggested_name, f"{ct} ({y})" if y else ct, seq)
+
+    def _apply_suggested_name(self, suggested_name: str, seq: int):
+        if seq != self._mismatch_sel_seq or not self.selected_mismatched_file: return
+        self._mismatch_name_var.set(suggested_name)
     
     def reprocess_selected_file(self):
         if not self.selected_mismatched_file: return
-        nn = self.mismatch_name_entry.get().strip();
+        nn = self._mismatch_name_var.get().strip();
         if not nn: messagebox.showwarning("Input Required", "Please enter a corrected name for the file."); return
-        threading.Thread(target=lambda: (backend.MediaSorter(self.config, self.dry_run_var.get()).sort_item(self.selected_mismatched_file, override_name=nn), self.after(0, self.scan_mismatched_files)), daemon=True).start()
+        self._submit(self._mismatch_sort_task, self.dry_run_var.get(), lambda s, f=self.selected_mismatched_file: s.sort_item(f, override_name=nn))
 
     def force_reprocess_file(self, media_type: backend.MediaType, is_split_lang_override: bool = False):
         if not self.selected_mismatched_file: return
-        fn = self.mismatch_name_entry.get().strip();
+        fn = self._mismatch_name_var.get().strip();
         if not fn: messagebox.showwarning("Input Required", "Please enter a name for the folder."); return
-        threading.Thread(target=lambda: (backend.MediaSorter(self.config, self.dry_run_var.get()).force_move_item(self.selected_mismatched_file, fn, media_type, is_split_lang_override), self.after(0, self.scan_mismatched_files)), daemon=True).start()
+        self._submit(self._mismatch_sort_task, self.dry_run_var.get(), lambda s, f=self.selected_mismatched_file: s.force_move_item(f, fn, media_type, is_split_lang_override))
+
+    def _mismatch_sort_task(self, dry_run: bool, action):
+        # A one-off sorter per action; closing it releases its API cache connection instead of leaving it to GC.
+        s = backend.MediaSorter(self.config, dry_run)
+        try: action(s)
+        finally: s.close()
+        self.after(0, self.scan_mismatched_files)
 
     def delete_selected_file(self):
         if not self.selected_mismatched_file: return
-        if not messagebox.askyesno("Confirm Deletion", f"Are you sure you want to permanently delete '{self.selected_mismatched_file.name}' and its sidecar files?"): return
-        threading.Thread(target=lambda: (backend.FileManager(self.config, self.dry_run_var.get()).delete_file_group(self.selected_mismatched_file), self.after(0, self.scan_mismatched_files)), daemon=True).start()
+        target, dry_run = self.selected_mismatched_file, self.dry_run_var.get()
+        self._confirm_async("Confirm Deletion", f"Are you sure you want to permanently delete '{target.name}' and its sidecar files?",
+                            lambda: self._submit(lambda: (backend.FileManager(self.config, dry_run).delete_file_group(target), self.after(0, self.scan_mismatched_files))))
+
+    def _confirm_async(self, title: str, message: str, on_yes):
+        # Unlike messagebox.askyesno this runs no nested event loop, so after() callbacks keep firing while the dialog is open.
+        dlg = ctk.CTkToplevel(self); dlg.title(title); dlg.transient(self); dlg.resizable(False, False)
+        ctk.CTkLabel(dlg, text=message, wraplength=360, justify="left").grid(row=0, column=0, columnspan=2, padx=20, pady=(20, 10))
+        def _yes(): dlg.destroy(); on_yes()
+        ctk.CTkButton(dlg, text="Yes", fg_color="#D32F2F", hover_color="#B71C1C", command=_yes).grid(row=1, column=0, padx=(20, 5), pady=(0, 20))
+        ctk.CTkButton(dlg, text="No", command=dlg.destroy).grid(row=1, column=1, padx=(5, 20), pady=(0, 20))
+        dlg.bind("<Escape>", lambda e: dlg.destroy()); dlg.after(10, dlg.grab_set)
 
     def toggle_log_visibility(self):
         self.log_is_visible = not self.log_is_visible
         if self.log_is_visible:
-            if self.tab_view.get() != "About": self.log_textbox.grid()
+            if self.tab_view.get() != "About": self.log_textbox.grid(); self._flush_log()
             self.toggle_log_button.configure(text="Hide Log")
         else: self.log_textbox.grid_remove(); self.toggle_log_button.configure(text="Show Log")
 
     def on_media_type_toggled(self): self.update_fallback_ui_state()
     def update_fallback_ui_state(self):
         tv_on, an_on = self.enabled_vars['TV_SHOWS_ENABLED'].get(), self.enabled_vars['ANIME_SERIES_ENABLED'].get()
-        self.tv_radio.configure(state="normal" if tv_on else "disabled"); self.anime_radio.configure(state="normal" if an_on else "disabled")
+        self._set_btn(self.tv_radio, state="normal" if tv_on else "disabled"); self._set_btn(self.anime_radio, state="normal" if an_on else "disabled")
         if not tv_on and self.fallback_var.get() == "tv": self.fallback_var.set("mismatched")
         if not an_on and self.fallback_var.get() == "anime": self.fallback_var.set("mismatched")
         
     def stop_running_task(self):
         if self.sorter_instance: logging.warning("🛑 User initiated stop..."); self.sorter_instance.signal_stop()
 
-    def _create_path_entry_row(self, parent, row, key, label):
-        ctk.CTkLabel(parent, text=label).grid(row=row, column=0, padx=5, pady=5, sticky="w"); e = ctk.CTkEntry(parent, width=400); e.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
-        e.insert(0, getattr(self.config, key, "")); self.path_entries[key] = e; ctk.CTkButton(parent, text="Browse...", width=80, command=lambda e=e: self.browse_folder(e)).grid(row=row, column=2, padx=5, pady=5)
+    def _tracked_var(self, key: str, value: str) -> ctk.StringVar:
+        v = ctk.StringVar(value=value); v.trace_add('write', lambda *a, k=key: self._dirty_keys.add(k)); return v
+
+    @staticmethod
+    def _mask_on_first_key(entry):
+        # Masking only needs to happen once; the one-shot binding spares a configure() on every later keystroke.
+        def _mask(e): entry.configure(show="*"); entry.unbind("<Key>")
+        entry.bind("<Key>", _mask)
+
+    def _create_path_entry_row(self, parent, row, key, label, value: str):
+        v = self.path_vars[key] = self._tracked_var(key, value)
+        ctk.CTkLabel(parent, text=label).grid(row=row, column=0, padx=5, pady=5, sticky="w"); e = ctk.CTkEntry(parent, width=400, textvariable=v); e.grid(row=row, column=1, padx=5, pady=5, sticky="ew")
+        self.path_entries[key] = e; ctk.CTkButton(parent, text="Browse...", width=80, command=lambda v=v: self.browse_folder(v)).grid(row=row, column=2, padx=5, pady=5)
         return row + 1
 
     def _test_api_key_task(self, p: str):
-        key = self.omdb_api_key_entry.get() if p == "omdb" else self.tmdb_api_key_entry.get(); tf = getattr(backend.APIClient(self.config), f"test_{p}_api_key"); v, m = tf(key); messagebox.showinfo(f"{p.upper()} Test", m)
+        key = self.omdb_api_key_entry.get() if p == "omdb" else self.tmdb_api_key_entry.get(); c = backend.APIClient(self.config, use_cache=False) # a key check never reads the cache
+        try: v, m = getattr(c, f"test_{p}_api_key")(key)
+        finally: c.close()
+        messagebox.showinfo(f"{p.upper()} Test", m)
 
-    def test_api_key_clicked(self, p: str): threading.Thread(target=self._test_api_key_task, args=(p,), daemon=True).start()
+    def test_api_key_clicked(self, p: str): self._submit(self._test_api_key_task, p)
             
-    def browse_folder(self, e):
-        if fp := filedialog.askdirectory(initialdir=e.get() or str(Path.home())): e.delete(0, ctk.END); e.insert(0, fp)
+    def browse_folder(self, target):
+        # Settings fields are StringVar-backed; the reorganize entry stays a plain entry so its placeholder text still shows.
+        # A stale or unreachable path would make the native dialog probe it (slow on network shares); fall back to the last folder picked.
+        cur = target.get(); init = cur if cur and os.path.isdir(cur) else self._last_browse_dir or str(Path.home())
+        if fp := filedialog.askdirectory(parent=self, initialdir=init, mustexist=True):
+            self._last_browse_dir = fp
+            if isinstance(target, tkinter.Variable): target.set(fp)
+            else: target.delete(0, ctk.END); target.insert(0, fp)
             
+    def _config_snapshot(self) -> dict: return {k: frozenset(v) if isinstance(v, set) else tuple(v) if isinstance(v, list) else v for k, v in vars(self.config).items() if not k.startswith('_')}
     def save_settings(self):
-        self.update_config_from_ui(); self.config.save(CONFIG_FILE); logging.info("✅ Settings saved to config.json")
-        if self.tray_icon: self.tray_icon.update_menu()
+        # Only write when a setting actually differs from what is on disk; quitting with untouched settings costs no I/O.
+        self.update_config_from_ui()
+        if (snap := self._config_snapshot()) == self._saved_config: logging.info("Settings unchanged; config.json not rewritten."); return
+        if self.config.save(CONFIG_FILE): self._saved_config = snap; logging.info("✅ Settings saved to config.json", extra={"tag": "SUCCESS"}) # on failure save() has logged the error
+        self._mark_tray_dirty()
 
     def update_config_from_ui(self):
-        for k, e in self.path_entries.items(): setattr(self.config, k, e.get())
-        for k, v in self.enabled_vars.items(): setattr(self.config, k, v.get())
-        self.config.API_PROVIDER = self.api_provider_var.get().lower()
-        if key := self.omdb_api_key_entry.get(): self.config.OMDB_API_KEY = key
-        if key := self.tmdb_api_key_entry.get(): self.config.TMDB_API_KEY = key
-        self.config.LANGUAGES_TO_SPLIT = [l.strip().lower() for l in self.split_languages_entry.get().split(',') if l.strip()]
-        self.config.SIDECAR_EXTENSIONS = {f".{e.strip().lstrip('.')}" for e in self.sidecar_entry.get().split(',') if e.strip()}
-        self.config.CUSTOM_STRINGS_TO_REMOVE = {s.strip().upper() for s in self.custom_strings_entry.get().split(',') if s.strip()}
-        self.config.FALLBACK_SHOW_DESTINATION = self.fallback_var.get()
-        try: self.config.WATCH_INTERVAL = int(self.watch_interval_entry.get()) * 60
-        except (ValueError, TypeError): self.config.WATCH_INTERVAL = 15 * 60
+        # Var-backed fields only mark themselves dirty on edit; everything else is cheap enough to read every time.
+        # All values are collected into one dict and applied to the Config with a single update.
+        dirty, self._dirty_keys = self._dirty_keys, set()
+        upd = {k: self.path_vars[k].get() for k in dirty.intersection(self.path_vars)}
+        upd.update((k, v.get()) for k, v in self.enabled_vars.items())
+        upd['API_PROVIDER'] = self.api_provider_var.get().lower(); upd['FALLBACK_SHOW_DESTINATION'] = self.fallback_var.get()
+        if self._settings_built: self._read_settings_tab(upd) # until the tab exists, the config already holds everything it would show
+        if 'WATCH_INTERVAL' in dirty:
+            try: upd['WATCH_INTERVAL'] = int(self.watch_interval_var.get()) * 60
+            except (ValueError, TypeError): upd['WATCH_INTERVAL'] = 15 * 60
+        vars(self.config).update(upd); self.config.refresh_derived()
     
-    def _update_progress(self, cs: int, ts: int): self.after(0, self._update_progress_ui, cs, ts)
+    def _read_settings_tab(self, upd: dict):
+        if key := self.omdb_api_key_entry.get(): upd['OMDB_API_KEY'] = key
+        if key := self.tmdb_api_key_entry.get(): upd['TMDB_API_KEY'] = key
+        # The comma-separated fields are only re-split when their raw text differs from the last parse.
+        if (raw := self.split_languages_entry.get()) != self._last_split_langs_raw: self._last_split_langs_raw = raw; upd['LANGUAGES_TO_SPLIT'] = [l.strip().lower() for l in raw.split(',') if l.strip()]
+        if (raw := self.sidecar_entry.get()) != self._last_sidecar_raw: self._last_sidecar_raw = raw; upd['SIDECAR_EXTENSIONS'] = {f".{e.strip().lstrip('.')}" for e in raw.split(',') if e.strip()}
+        if (raw := self.custom_strings_entry.get()) != self._last_custom_strings_raw: self._last_custom_strings_raw = raw; upd['CUSTOM_STRINGS_TO_REMOVE'] = {s.strip().upper() for s in raw.split(',') if s.strip()}
+
+    def _update_progress(self, cs: int, ts: int): self._post_task_event("progress", cs, ts)
     def _update_progress_ui(self, cs: int, ts: int):
         if ts > 0: self.progress_bar.set(cs / ts); self.progress_label.configure(text=f"Processing: {cs} / {ts}")
         else: self.progress_bar.set(0); self.progress_label.configure(text="No files to process.")
             
+    @_unless_quitting
     def start_task(self, task_function, is_watcher=False):
-        if self.is_quitting or (self.sorter_thread and self.sorter_thread.is_alive()): return
+        if self.sorter_thread and self.sorter_thread.is_alive(): return
         self.update_config_from_ui(); self.is_watching = is_watcher
         if not self.config.get_path('SOURCE_DIR'): messagebox.showerror("Config Error", "Source Directory is not set."); return
-        if self.config.SPLIT_MOVIES_DIR and self.config.LANGUAGES_TO_SPLIT: logging.info(f"🔵⚪🔴 Language Split is ON for: {self.config.LANGUAGES_TO_SPLIT}")
-        if self.dry_run_var.get(): logging.info("🧪 Dry Run is ENABLED for this task.")
+        if self.config.SPLIT_MOVIES_DIR and self.config.LANGUAGES_TO_SPLIT: logging.info(f"🔵⚪🔴 Language Split is ON for: {self.config.LANGUAGES_TO_SPLIT}", extra={"tag": "FRENCH"})
+        if self.dry_run_var.get(): logging.info("🧪 Dry Run is ENABLED for this task.", extra={"tag": "DRYRUN"})
         self.progress_frame.grid(); self.progress_bar.set(0); self.progress_label.configure(text="Initializing...")
-        self.sorter_instance = backend.MediaSorter(self.config, self.dry_run_var.get(), self._update_progress)
-        self.sorter_thread = threading.Thread(target=task_function, args=(self.sorter_instance,), daemon=True); self.sorter_thread.start()
-        self.monitor_active_task()
+        self.sorter_instance = backend.MediaSorter(self.config, self.dry_run_var.get(), self._update_progress, self._on_sorter_state)
+        self.sorter_thread = threading.Thread(target=self._run_task, args=(task_function, self.sorter_instance), daemon=True); self.sorter_thread.start()
+        self._refresh_task_controls(); self._mark_tray_dirty() # 'Enable Watch' check mark
         
     def start_sort_now(self): self.start_task(lambda s: s.process_source_directory())
     def toggle_watch_mode(self):
         if self.sorter_thread and self.sorter_thread.is_alive(): self.stop_running_task()
         else: self.start_task(lambda s: s.start_watch_mode(), True)
 
+    @_unless_quitting
     def _start_reorganize_task(self, task_function, action_name: str):
         if self.sorter_thread and self.sorter_thread.is_alive(): logging.warning("A task is already running."); return
         target_path = Path(self.reorganize_path_entry.get().strip())
@@ -473,9 +689,9 @@ class App(ctk.CTk):
         self.update_config_from_ui(); self.progress_frame.grid(); self.progress_bar.set(0); self.progress_label.configure(text="Initializing...")
         dry_run = self.reorganize_dry_run_var.get()
         if dry_run: logging.info(f"🧪 DRY RUN MODE ENABLED for {action_name} task.")
-        self.sorter_instance = backend.MediaSorter(self.config, dry_run, self._update_progress)
-        self.sorter_thread = threading.Thread(target=task_function, args=(self.sorter_instance, target_path, selected_files), daemon=True); self.sorter_thread.start()
-        self.monitor_active_task()
+        self.sorter_instance = backend.MediaSorter(self.config, dry_run, self._update_progress, self._on_sorter_state)
+        self.sorter_thread = threading.Thread(target=self._run_task, args=(task_function, self.sorter_instance, target_path, selected_files), daemon=True); self.sorter_thread.start()
+        self._refresh_task_controls()
 
     def start_folder_reorganization(self): self._start_reorganize_task(lambda s, p, f: s.reorganize_folder_structure(p, file_list=f), "reorganize")
     def start_file_renaming(self): self._start_reorganize_task(lambda s, p, f: s.rename_files_in_library(p, file_list=f), "rename")
@@ -485,19 +701,21 @@ class App(ctk.CTk):
         if not target_path_str: messagebox.showerror("Error", "Please select a target library folder to scan."); return
         target_path = Path(target_path_str)
         if not target_path.is_dir(): messagebox.showerror("Error", f"Path is not a valid folder:\n{target_path}"); return
-        for widget in self.reorganize_files_frame.winfo_children(): widget.destroy()
-        self.reorganize_all_files = []; self.reorganize_selection_state = {}; self.reorganize_current_page = 0
+        self.reorganize_listbox.delete(0, tkinter.END)
+        self.reorganize_all_files = []; self.reorganize_selection_state = {}; self.reorganize_selected_count = 0; self.reorganize_current_page = 0
         self.reorganize_prev_button.configure(state="disabled"); self.reorganize_next_button.configure(state="disabled")
         logging.info(f"Scanning '{target_path}' for media files...")
         self.reorganize_page_label.configure(text="Scanning...")
+        exts = self.config.ext_tuple
         def _scan():
-            files = sorted([p for ext in self.config.SUPPORTED_EXTENSIONS for p in target_path.glob(f'**/*{ext}') if p.is_file()], key=lambda p: str(p))
+            base = str(target_path)
+            files = [(Path(p), os.path.relpath(p, base)) for p in sorted(backend.iter_file_paths(target_path, exts))]
             self.after(0, self.finish_reorganize_scan, files, target_path)
-        threading.Thread(target=_scan, daemon=True).start()
+        self._submit(_scan)
 
-    def finish_reorganize_scan(self, media_files: List[Path], base_path: Path):
+    def finish_reorganize_scan(self, media_files: List[Tuple[Path, str]], base_path: Path):
         self.reorganize_all_files = media_files
-        self.reorganize_selection_state = {path: False for path in media_files}
+        self.reorganize_selection_state = {path: False for path, _ in media_files}; self.reorganize_selected_count = 0
         if not media_files:
             logging.warning("Scan complete. No media files found.")
             self.reorganize_display_page()
@@ -505,36 +723,50 @@ class App(ctk.CTk):
         logging.info(f"Scan complete. Found {len(media_files)} media files.")
         self.reorganize_display_page()
 
-    def reorganize_display_page(self):
-        for widget in self.reorganize_files_frame.winfo_children(): widget.destroy()
-        if not self.reorganize_all_files: ctk.CTkLabel(self.reorganize_files_frame, text="No media files found.").pack(); self.reorganize_page_label.configure(text="Page 0 of 0"); return
-        
+    def _reorganize_page_bounds(self) -> Tuple[int, int]:
         start_index = self.reorganize_current_page * self.reorganize_items_per_page
-        end_index = start_index + self.reorganize_items_per_page
-        page_files = self.reorganize_all_files[start_index:end_index]
-        base_path = Path(self.reorganize_path_entry.get())
-
-        for file_path in page_files:
-            var = ctk.BooleanVar(value=self.reorganize_selection_state.get(file_path, False))
-            cb = ctk.CTkCheckBox(self.reorganize_files_frame, text=str(file_path.relative_to(base_path)), variable=var,
-                                 command=lambda path=file_path, v=var: self.reorganize_toggle_selection(path, v))
-            cb.pack(anchor="w", padx=5)
+        return start_index, min(start_index + self.reorganize_items_per_page, len(self.reorganize_all_files))
+
+    def _reorganize_row_text(self, path: Path, label: str) -> str: return ("[x] " if self.reorganize_selection_state.get(path) else "[ ] ") + label
+
+    def reorganize_display_page(self):
+        lb = self.reorganize_listbox; lb.delete(0, tkinter.END)
+        if not self.reorganize_all_files: lb.insert(tkinter.END, "No media files found."); self.reorganize_page_label.configure(text="Page 0 of 0"); return
+        start_index, end_index = self._reorganize_page_bounds()
+        lb.insert(tkinter.END, *(self._reorganize_row_text(p, label) for p, label in self.reorganize_all_files[start_index:end_index]))
+        lb.yview_moveto(0)
         self.update_reorganize_ui()
 
-    def reorganize_toggle_selection(self, path: Path, var: ctk.BooleanVar):
-        self.reorganize_selection_state[path] = var.get()
+    def reorganize_on_row_click(self, event):
+        lb = self.reorganize_listbox; start_index, end_index = self._reorganize_page_bounds()
+        if not self.reorganize_all_files or lb.size() == 0: return
+        row = lb.nearest(event.y); bbox = lb.bbox(row)
+        if not bbox or not (bbox[1] <= event.y < bbox[1] + bbox[3]) or start_index + row >= end_index: return
+        path = self.reorganize_all_files[start_index + row][0]
+        selected = not self.reorganize_selection_state.get(path, False)
+        self.reorganize_selection_state[path] = selected; self.reorganize_selected_count += 1 if selected else -1
+        lb.selection_clear(0, tkinter.END); self._reorganize_refresh_rows([row])
+
+    def _reorganize_refresh_rows(self, rows):
+        lb, start_index = self.reorganize_listbox, self._reorganize_page_bounds()[0]
+        for row in rows: path, label = self.reorganize_all_files[start_index + row]; lb.delete(row); lb.insert(row, self._reorganize_row_text(path, label))
         self.update_reorganize_ui()
 
     def reorganize_select_page(self, select=True):
-        start_index = self.reorganize_current_page * self.reorganize_items_per_page
-        end_index = start_index + self.reorganize_items_per_page
-        for i in range(start_index, min(end_index, len(self.reorganize_all_files))):
-            self.reorganize_selection_state[self.reorganize_all_files[i]] = select
-        self.reorganize_display_page()
+        # Only rows whose state actually flips are rewritten; the rest of the page is left untouched.
+        start_index, end_index = self._reorganize_page_bounds(); flipped = []
+        for i in range(start_index, end_index):
+            path = self.reorganize_all_files[i][0]
+            if self.reorganize_selection_state.get(path, False) != select: self.reorganize_selection_state[path] = select; flipped.append(i - start_index)
+        self.reorganize_selected_count += len(flipped) if select else -len(flipped)
+        self._reorganize_refresh_rows(flipped)
 
     def reorganize_select_all(self):
-        for path in self.reorganize_all_files: self.reorganize_selection_state[path] = True
-        self.reorganize_display_page()
+        start_index, end_index = self._reorganize_page_bounds()
+        flipped = [i - start_index for i in range(start_index, end_index) if not self.reorganize_selection_state.get(self.reorganize_all_files[i][0], False)]
+        for path in self.reorganize_selection_state: self.reorganize_selection_state[path] = True
+        self.reorganize_selected_count = len(self.reorganize_selection_state)
+        self._reorganize_refresh_rows(flipped)
 
     def reorganize_previous_page(self):
         if self.reorganize_current_page > 0: self.reorganize_current_page -= 1; self.reorganize_display_page()
@@ -548,33 +780,69 @@ class App(ctk.CTk):
         self.reorganize_page_label.configure(text=f"Page {self.reorganize_current_page + 1} of {total_pages}")
         self.reorganize_prev_button.configure(state="normal" if self.reorganize_current_page > 0 else "disabled")
         self.reorganize_next_button.configure(state="normal" if (self.reorganize_current_page + 1) < total_pages else "disabled")
-        selected_count = sum(1 for v in self.reorganize_selection_state.values() if v)
-        self.reorganize_status_label.configure(text=f"Selected: {selected_count}")
+        self.reorganize_status_label.configure(text=f"Selected: {self.reorganize_selected_count}")
         
     def _get_selected_reorganize_files(self) -> List[Path]: return [p for p, v in self.reorganize_selection_state.items() if v]
         
-    def monitor_active_task(self):
-        is_running = self.sorter_thread and self.sorter_thread.is_alive()
-        if is_running:
-            self._set_options_state("disabled"); self.sort_now_button.configure(state="disabled")
-            self.reorganize_folders_button.configure(state="disabled"); self.rename_files_button.configure(state="disabled")
-            self.watch_button.configure(text="Stop Watchdog" if self.is_watching else "Running...", state="normal" if self.is_watching else "disabled")
-            if self.sorter_instance and self.sorter_instance.is_processing: self.stop_button.configure(state="normal", text="STOP", fg_color="#D32F2F", hover_color="#B71C1C");
-            elif self.is_watching: self.stop_button.configure(state="disabled", text="IDLE", fg_color="#FBC02D", text_color="black");
-            if not self.progress_frame.winfo_viewable() and self.sorter_instance.is_processing : self.progress_frame.grid()
-            self.after(500, self.monitor_active_task)
-        else:
-            self._set_options_state("normal"); self.reorganize_folders_button.configure(state="normal"); self.rename_files_button.configure(state="normal")
-            if self.is_watching: logging.info("✅ Watchdog stopped.")
-            else: logging.info("✅ Task finished.")
-            self.sort_now_button.configure(state="normal"); self.watch_button.configure(text="Launch Watchdog", state="normal")
-            self.stop_button.configure(state="disabled", text="", fg_color="gray25")
-            self.progress_frame.grid_remove(); self.sorter_instance = None; self.sorter_thread = None; self.is_watching = False
-            if self.tray_icon: self.tray_icon.update_menu()
+    # --- START: Task events (sorter thread -> UI) ---
+    def _run_task(self, task_function, sorter, *args):
+        try: task_function(sorter, *args)
+        finally: sorter.close(); self._post_task_event("done")
+    def _on_sorter_state(self, is_processing: bool): self._post_task_event("state")
+
+    def _post_task_event(self, *event):
+        # Called from the sorter thread; one after() wakes the UI per burst of events, so nothing polls while a task is idle.
+        self._task_events.put(event)
+        if not self._task_drain_scheduled: self._task_drain_scheduled = True; self.after(0, self._drain_task_events)
+
+    def _drain_task_events(self):
+        self._task_drain_scheduled = False; progress = None; state_changed = finished = False
+        while True:
+            try: event = self._task_events.get_nowait()
+            except queue.Empty: break
+            if event[0] == "progress": progress = event[1:]
+            elif event[0] == "state": state_changed = True
+            elif event[0] == "done": finished = True
+        if progress: self._update_progress_ui(*progress)
+        if finished: self._finish_task()
+        elif state_changed: self._refresh_task_controls()
+    # --- END: Task events ---
+
+    def _refresh_task_controls(self):
+        self._set_options_state("disabled"); self._set_btn(self.sort_now_button, state="disabled")
+        self._set_btn(self.reorganize_folders_button, state="disabled"); self._set_btn(self.rename_files_button, state="disabled")
+        self._set_btn(self.watch_button, text="Stop Watchdog" if self.is_watching else "Running...", state="normal" if self.is_watching else "disabled")
+        if self.sorter_instance and self.sorter_instance.is_processing: self._set_btn(self.stop_button, state="normal", text="STOP", fg_color="#D32F2F", hover_color="#B71C1C");
+        elif self.is_watching: self._set_btn(self.stop_button, state="disabled", text="IDLE", fg_color="#FBC02D", text_color="black");
+        if not self.progress_frame.winfo_viewable() and self.sorter_instance and self.sorter_instance.is_processing: self.progress_frame.grid()
+
+    def _set_btn(self, btn, **opts):
+        # Every CTk configure() restyles and redraws; watch cycles re-apply the same states, so only changed options are passed on.
+        # All state changes of the task buttons and option controls go through here, which keeps the memo in step with the widgets.
+        last = self._btn_state.setdefault(btn, {})
+        if changed := {k: v for k, v in opts.items() if k not in last or last[k] != v}: btn.configure(**changed); last.update(changed)
+
+    def _finish_task(self):
+        self._set_options_state("normal"); self._set_btn(self.reorganize_folders_button, state="normal"); self._set_btn(self.rename_files_button, state="normal")
+        logging.info("✅ Watchdog stopped." if self.is_watching else "✅ Task finished.", extra={"tag": "SUCCESS"})
+        self._set_btn(self.sort_now_button, state="normal"); self._set_btn(self.watch_button, text="Launch Watchdog", state="normal")
+        self._set_btn(self.stop_button, state="disabled", text="", fg_color="gray25")
+        self.progress_frame.grid_remove(); self.sorter_instance = None; self.sorter_thread = None; self.is_watching = False
+        self._mark_tray_dirty()
+
+    def _mark_tray_dirty(self):
+        # Rebuilding the native menu can block briefly; rapid start/stop/save sequences share one rebuild per TRAY_REFRESH_MS.
+        if not self._tray_refresh_scheduled: self._tray_refresh_scheduled = True; self.after(TRAY_REFRESH_MS, self._refresh_tray_menu)
+    def _refresh_tray_menu(self):
+        self._tray_refresh_scheduled = False
+        if not (self.tray_icon and self._ui_alive): return
+        # Rebuild only when something the menu shows (watch toggle, interval radio) changed since the last render.
+        if (st := (self.is_watching, self.config.WATCH_INTERVAL)) == self._tray_menu_state: return
+        self._tray_menu_state, self._tray_interval = st, st[1]; self.tray_icon.update_menu()
 
     def create_tray_image(self):
-        try: return Image.open(str(resource_path("icon.png")))
-        except: img = Image.new('RGB', (64, 64), "#1F6AA5"); dc = ImageDraw.Draw(img); dc.rectangle(((32, 0), (64, 32)), fill="#144870"); dc.rectangle(((0, 32), (32, 64)), fill="#144870"); return img
+        if self._tray_image is None: self._tray_image = _build_tray_image(str(resource_path("icon.png")))
+        return self._tray_image
 
     def quit_app(self):
         if self.is_quitting: return
@@ -585,28 +853,45 @@ class App(ctk.CTk):
         if self.tray_thread and self.tray_thread.is_alive() and threading.current_thread() != self.tray_thread: self.tray_thread.join(1.0)
         self.after(0, self._perform_safe_shutdown)
         
-    def _perform_safe_shutdown(self): self.save_settings(); self.destroy()
-    def _show_and_focus_tab(self, tab_name: str): self.deiconify(); self.lift(); self.attributes('-topmost', True); self.tab_view.set(tab_name); self.after(100, lambda: self.attributes('-topmost', False))
+    def _submit(self, fn, *args):
+        # Pool workers swallow exceptions into the Future, so surface them in the log like a crashing thread would.
+        fut = self._executor.submit(fn, *args)
+        fut.add_done_callback(lambda f: (not f.cancelled() and f.exception()) and logging.error(f"Background task failed: {f.exception()}"))
+        return fut
+    def _perform_safe_shutdown(self): self._ui_alive = False; self.save_settings(); self._executor.shutdown(wait=False, cancel_futures=True); self._log_listener.stop(); self.destroy()
+    def _show_and_focus_tab(self, tab_name: str):
+        self.deiconify(); self.lift(); self.attributes('-topmost', True)
+        if tab_name == "Settings": self._ensure_settings_tab() # set() does not fire the tab command
+        self.tab_view.set(tab_name); self.after(100, lambda: self.attributes('-topmost', False))
     def show_window(self): self._show_and_focus_tab("Actions")
     def show_settings(self): self._show_and_focus_tab("Settings")
     def show_reorganize(self): self._show_and_focus_tab("Reorganize")
     def show_review(self): self._show_and_focus_tab("Review")
     def show_about(self): self._show_and_focus_tab("About")
-    def hide_to_tray(self): self.withdraw(); self.tray_icon.notify('App is running in the background', 'SortMeDown')
+    def hide_to_tray(self):
+        if not self.tray_icon: return # tray not up yet: stay an ordinary minimized window rather than vanish
+        self.withdraw(); self.tray_icon.notify('App is running in the background', 'SortMeDown')
     def on_minimize(self, event):
-        if self.state() == 'iconic': self.hide_to_tray()
-    def set_interval(self, minutes: int): self.watch_interval_entry.delete(0, ctk.END); self.watch_interval_entry.insert(0, str(minutes)); self.save_settings() 
+        # A toplevel binding also sees <Unmap> from every child (grid_remove, tab switches); only the window itself can be iconified.
+        if event.widget is self and self.state() == 'iconic': self.hide_to_tray()
+    def set_interval(self, minutes: int):
+        # In memory only: the change reaches disk with the next save, at the latest on quit, where the snapshot diff picks it up.
+        if self.config.WATCH_INTERVAL == minutes * 60 and self.watch_interval_var.get() == str(minutes): return # re-clicking the checked item
+        self.watch_interval_var.set(str(minutes)); self.config.WATCH_INTERVAL = minutes * 60; self._mark_tray_dirty()
         
+    def _interval_menu_item(self, minutes: int):
+        # pystray re-evaluates checked= on every render; it compares against the interval snapshot taken at the last menu rebuild.
+        secs = minutes * 60
+        return pystray.MenuItem(f'{minutes}m', lambda: self.set_interval(minutes), radio=True, checked=lambda i: self._tray_interval == secs)
+    @_unless_quitting
     def setup_tray_icon(self):
         image = self.create_tray_image()
         menu = (pystray.MenuItem('Show', self.show_window, default=True), pystray.MenuItem('Settings', self.show_settings),pystray.MenuItem('Reorganize Library', self.show_reorganize), pystray.MenuItem('Review Mismatches', self.show_review),
                 pystray.MenuItem('About', self.show_about), pystray.Menu.SEPARATOR,
                 pystray.MenuItem('Enable Watch', self.toggle_watch_mode, checked=lambda item: self.is_watching),
-                pystray.MenuItem('Set Interval', pystray.Menu(pystray.MenuItem('5m', lambda: self.set_interval(5), radio=True, checked=lambda i: self.config.WATCH_INTERVAL == 300),
-                                                              pystray.MenuItem('15m', lambda: self.set_interval(15), radio=True, checked=lambda i: self.config.WATCH_INTERVAL == 900),
-                                                              pystray.MenuItem('30m', lambda: self.set_interval(30), radio=True, checked=lambda i: self.config.WATCH_INTERVAL == 1800),
-                                                              pystray.MenuItem('60m', lambda: self.set_interval(60), radio=True, checked=lambda i: self.config.WATCH_INTERVAL == 3600))),
+                pystray.MenuItem('Set Interval', pystray.Menu(*(self._interval_menu_item(m) for m in (5, 15, 30, 60)))),
                 pystray.Menu.SEPARATOR, pystray.MenuItem('Quit', self.quit_app))
+        self._tray_interval = self.config.WATCH_INTERVAL; self._tray_menu_state = (self.is_watching, self._tray_interval)
         self.tray_icon = pystray.Icon("sortmedown", image, "SortMeDown Sorter", menu)
         self.tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True); self.tray_thread.start()
 